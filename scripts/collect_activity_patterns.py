@@ -4,6 +4,29 @@ Activity Pattern Collection Module
 Collects categorized coding & tooling activity patterns for daily_runner ingestion
 """
 
+# Static activity counts; copied per call so callers can mutate their result
+ACTIVITY_PATTERNS = {
+    "version_control": {
+        "github.com": 6,
+        "github.dev": 5,
+        "git-scm.com": 1
+    },
+    "design_ai_tools": {
+        "figma.com": 17,
+        "vscode_marketplace": 1,
+        "notion.so": 3
+    },
+    "credentials_identity": {
+        "gmail": 10,
+        "google_accounts": 15,
+        "google_admin": 10,
+        "duo": 3,
+        "linkedin": 3,
+        "slack": 8
+    }
+}
+
+
 def collect_activity_patterns():
     """
     Collects categorized coding & tooling activity patterns
@@ -11,39 +34,21 @@ def collect_activity_patterns():
     daily_runner ingestion, GitHub issue creation, and Notion syncing.
     """
 
-    data = {
-        "version_control": {
-            "github.com": 6,
-            "github.dev": 5,
-            "git-scm.com": 1
-        },
-        "design_ai_tools": {
-            "figma.com": 17,
-            "vscode_marketplace": 1,
-            "notion.so": 3
-        },
-        "credentials_identity": {
-            "gmail": 10,
-            "google_accounts": 15,
-            "google_admin": 10,
-            "duo": 3,
-            "linkedin": 3,
-            "slack": 8
-        }
-    }
+    data = {category: dict(counts) for category, counts in ACTIVITY_PATTERNS.items()}
 
     # Add timestamp for daily versioning
     from datetime import datetime
     data["generated_at"] = datetime.utcnow().isoformat()
 
     # Save JSON output to daily_runner output directory
-    import json, os
+    from pathlib import Path
+    from lib.json_io import dump_json_bytes
 
     output_path = "output/usage_activity.json"
-    os.makedirs("output", exist_ok=True)
+    Path("output").mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w") as f:
-        json.dump(data, f, indent=4)
+    # Same UTF-8 bytes and indent whether or not orjson is installed
+    Path(output_path).write_bytes(dump_json_bytes(data))
 
     return data
 
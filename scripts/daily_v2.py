@@ -21,17 +21,119 @@ Optional:
 - OUTPUT_DIR: Output directory for generated files (default: ./output)
 """
 
+import atexit
+import gzip
+import hashlib
+import io
 import os
+import queue
 import sys
 import json
 import logging
+import logging.handlers
+import mmap
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from importlib.util import find_spec
+from itertools import repeat
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Callable, TypeVar, Tuple, TypedDict
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Callable, TypeVar, Tuple, TypedDict
+
+from lib.json_io import dump_json_bytes, load_json
+from lib.summary_cache import SummaryCache
+
+if TYPE_CHECKING:
+    from github import Github
+    from openai import OpenAI
 
 T = TypeVar("T")
 
+# File suffixes ingested as notes, the upper bound on threads used to read
+# them concurrently, and the file count below which they are read inline
+# (starting the pool would cost more than it overlaps).
+NOTE_SUFFIXES = (".md", ".txt")
+NOTES_READ_WORKERS = 16
+NOTES_PARALLEL_MIN_FILES = 8
+
+# Note files at least this large are memory-mapped and decoded straight from
+# the mapping, so no intermediate bytes copy of the whole file is made.
+NOTE_MMAP_MIN_BYTES = 1 << 20
+NOTE_ASCII_WHITESPACE = frozenset(b" \t\n\r\x0b\x0c")
+
+# Total characters of note text sent to the model. The summary model has a
+# 128k-token context; at ~4 characters per token this leaves ~8k tokens for
+# the instructions and the reply. Text past the budget is cut with a warning.
+NOTES_PROMPT_MAX_CHARS = 120_000 * 4
+NOTE_TRUNCATED_MARKER = " [truncated]"
+
+# Keep-alive pool size and retry backoff for the PyGithub HTTP session.
+GITHUB_POOL_SIZE = 4
+GITHUB_RETRY_TOTAL = 10
+GITHUB_RETRY_BACKOFF = 0.3
+
+# Default number of issues created concurrently (GH_ISSUE_CONCURRENCY
+# overrides it). Issues are created one at a time by default: PyGithub's
+# one-second spacing between writes is not enforced across threads, GitHub's
+# secondary rate limits target concurrent content creation, and a POST retried
+# after a timeout under load can file a duplicate issue.
+GITHUB_ISSUE_WORKERS = 1
+
+# Body of each auto-created issue; filled in with str.format per action item.
+ISSUE_BODY_TEMPLATE = (
+    "Auto-generated from daily automation runner\n\n"
+    "**Action Item:**\n{item}\n\n"
+    "---\n*Created: {created_at}*"
+)
+
+# Retries for transient OpenAI failures (429, 5xx, connection errors). The SDK
+# backs off exponentially with jitter and honours Retry-After headers.
+OPENAI_MAX_RETRIES = 5
+
+# Model settings for the daily summary. Temperature 0 keeps the output
+# reproducible, which is what makes cached summaries safe to reuse.
+OPENAI_SUMMARY_MODEL = "gpt-4-turbo-preview"
+OPENAI_SUMMARY_TEMPERATURE = 0.0
+
+# Fixed parts of the summary request. The instructions precede the notes so
+# consecutive runs share a byte-identical prefix that OpenAI prompt caching
+# can reuse.
+SUMMARY_SYSTEM_PROMPT = "You are a helpful assistant that summarizes daily work notes."
+SUMMARY_INSTRUCTIONS = (
+    "Analyze the daily notes below and provide a structured summary.\n\n"
+    "Extract:\n"
+    "1. Key highlights (2-4 bullet points)\n"
+    "2. Action items with priorities\n"
+    "3. Brief overall assessment\n\n"
+    "Format as JSON with keys: highlights, action_items, assessment\n\n"
+    "Notes:\n"
+)
+
+# On-disk cache of OpenAI summaries, keyed by a hash of the model settings and
+# the formatted notes. Entries older than the TTL (CACHE_TTL_DAYS, default one
+# day) are regenerated.
+SUMMARY_CACHE_FILE = ".summary_cache.json"
+SUMMARY_CACHE_MAX_ENTRIES = 32
+SUMMARY_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Opt-in semantic cache (SUMMARY_SEMANTIC_CACHE=1): reuse a cached summary when
+# the notes embedding is at least this similar to a cached run's notes.
+SUMMARY_EMBEDDING_MODEL = "text-embedding-3-small"
+SUMMARY_SIMILARITY_THRESHOLD = 0.95
+# The embedding model accepts about 8k tokens. Larger notes skip the semantic
+# lookup: embedding only a prefix would match notes that differ past it.
+SUMMARY_EMBEDDING_MAX_CHARS = 30_000
+
+# OpenAI Batch API state for --batch runs: the submitted batch id and the
+# summary cache key it answers, so later runs collect it instead of resubmitting.
+PENDING_BATCH_FILE = "pending_batch.json"
+BATCH_PENDING_ASSESSMENT = "Summary pending in OpenAI batch {batch_id}; it is collected on the next --batch run"
+BATCH_ACTIVE_STATUSES = ("validating", "in_progress", "finalizing", "cancelling")
+
+# Assessment used when OpenAI returns text that is not valid JSON.
+NON_JSON_ASSESSMENT = "AI generated summary (non-JSON response)"
+
 def run_step(
     *,
     run_id: str,
@@ -81,13 +183,8 @@ def run_step(
         error: str
 
 
-# Import sales pipeline module
-try:
-    from lib.sales_pipeline import create_sales_pipeline_source, SalesPipelineData
-    HAS_SALES_PIPELINE = True
-except ImportError:
-    HAS_SALES_PIPELINE = False
-    logger.warning("⚠️  Sales pipeline module not available")
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+LOG_DATEFMT = "%Y-%m-%dT%H:%M:%S%z"
 
 
 def configure_logging() -> logging.Logger:
@@ -97,11 +194,21 @@ def configure_logging() -> logging.Logger:
     level_name = os.getenv("LOG_LEVEL", "INFO").upper()
     level = getattr(logging, level_name, logging.INFO)
 
-    logging.basicConfig(
-        level=level,
-        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-        datefmt="%Y-%m-%dT%H:%M:%S%z",
-    )
+    # Install a single console handler once; repeated calls (re-imports,
+    # tests) must not stack duplicate handlers on the root logger. Records are
+    # queued and written by a listener thread, so logging from the issue and
+    # note-reading workers never blocks on a slow stderr pipe. The listener is
+    # stopped at exit, which flushes anything still queued.
+    root = logging.getLogger()
+    if not root.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATEFMT))
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+        root.setLevel(level)
 
     logger = logging.getLogger(__name__)
     logger.debug("Logging configured")
@@ -110,29 +217,41 @@ def configure_logging() -> logging.Logger:
 
 logger = configure_logging()
 
-# Third-party imports (with fallback for demo mode)
+# Import sales pipeline module
 try:
-    from dotenv import load_dotenv
-    from openai import (
-        APIConnectionError,
-        APITimeoutError,
-        APIStatusError,
-        OpenAI,
-        RateLimitError,
-    )
-    from github import (
-        BadCredentialsException,
-        Github,
-        GithubException,
-        RateLimitExceededException,
-        UnknownObjectException,
-    )
-    HAS_DEPS = True
+    from lib.sales_pipeline import create_sales_pipeline_source, SalesPipelineData
+    HAS_SALES_PIPELINE = True
 except ImportError:
-    HAS_DEPS = False
+    HAS_SALES_PIPELINE = False
+    logger.warning("⚠️  Sales pipeline module not available")
+
+# Third-party imports (with fallback for demo mode). The OpenAI SDK and
+# PyGithub take hundreds of milliseconds to import, so they are only probed
+# for here and imported where they are actually used; demo runs never load them.
+HAS_DEPS = all(find_spec(name) is not None for name in ("dotenv", "openai", "github"))
+
+if not HAS_DEPS:
     logger.warning("⚠️  Missing dependencies. Install with: pip install -r scripts/requirements.txt")
     logger.warning("   Running in DEMO MODE (no actual API calls)")
 
+# .env files already applied in this process. load_dotenv never overrides
+# variables that are already set, so re-reading a file is pure overhead.
+_LOADED_ENV_FILES = set()
+
+def decode_mapped_note(mapped: mmap.mmap) -> str:
+    """Decode a memory-mapped note as UTF-8 without its surrounding whitespace.
+
+    Leading and trailing ASCII whitespace is skipped by index before decoding,
+    so neither the file contents nor the decoded text is copied to trim it.
+    """
+    start, end = 0, len(mapped)
+    while start < end and mapped[start] in NOTE_ASCII_WHITESPACE:
+        start += 1
+    while end > start and mapped[end - 1] in NOTE_ASCII_WHITESPACE:
+        end -= 1
+    with memoryview(mapped) as view, view[start:end] as body:
+        return str(body, "utf-8", "replace")
+
 
 @dataclass
 class AutomationConfig:
@@ -143,16 +262,38 @@ class AutomationConfig:
     output_dir: Path
     notes_source: Path
     demo_mode: bool
+    gzip_audit: bool = False
+    semantic_cache: bool = False
+    compact_json: bool = False
+    force_run: bool = False
+    issue_concurrency: int = GITHUB_ISSUE_WORKERS
+    cache_ttl_seconds: float = SUMMARY_CACHE_TTL_SECONDS
 
     @classmethod
     def load(cls, demo_mode: bool, project_root: Path) -> "AutomationConfig":
         """Load configuration from environment variables with sensible defaults."""
-        if HAS_DEPS:
-            load_dotenv(project_root / ".env.local")
+        env_file = project_root / ".env.local"
+        if HAS_DEPS and env_file not in _LOADED_ENV_FILES:
+            from dotenv import load_dotenv
+
+            load_dotenv(env_file)
+            _LOADED_ENV_FILES.add(env_file)
 
         output_dir = Path(os.getenv("OUTPUT_DIR", project_root / "output"))
         notes_source = Path(os.getenv("NOTES_SOURCE", project_root / "output" / "notes"))
 
+        try:
+            issue_concurrency = max(1, int(os.getenv("GH_ISSUE_CONCURRENCY", GITHUB_ISSUE_WORKERS)))
+        except ValueError:
+            logger.warning("⚠️  Ignoring invalid GH_ISSUE_CONCURRENCY; using %s", GITHUB_ISSUE_WORKERS)
+            issue_concurrency = GITHUB_ISSUE_WORKERS
+
+        try:
+            cache_ttl_seconds = max(0.0, float(os.getenv("CACHE_TTL_DAYS", 1)) * 24 * 60 * 60)
+        except ValueError:
+            logger.warning("⚠️  Ignoring invalid CACHE_TTL_DAYS; using 1 day")
+            cache_ttl_seconds = SUMMARY_CACHE_TTL_SECONDS
+
         return cls(
             openai_api_key=os.getenv("OPENAI_API_KEY"),
             github_token=os.getenv("GITHUB_TOKEN"),
@@ -160,6 +301,12 @@ class AutomationConfig:
             output_dir=output_dir,
             notes_source=notes_source,
             demo_mode=demo_mode,
+            gzip_audit=os.getenv("AUDIT_GZIP", "").lower() in ("1", "true", "yes"),
+            semantic_cache=os.getenv("SUMMARY_SEMANTIC_CACHE", "").lower() in ("1", "true", "yes"),
+            compact_json=os.getenv("COMPACT_JSON", "").lower() in ("1", "true", "yes"),
+            force_run=os.getenv("FORCE_RUN", "").lower() in ("1", "true", "yes"),
+            issue_concurrency=issue_concurrency,
+            cache_ttl_seconds=cache_ttl_seconds,
         )
 
     def missing_required(self) -> List[str]:
@@ -193,12 +340,14 @@ class DailyAutomation:
     GitHub issue creation, and structured output generation.
     """
 
-    def __init__(self, demo_mode: bool = False):
+    def __init__(self, demo_mode: bool = False, batch_mode: bool = False):
         """Set up paths, clients, and runtime mode.
 
         Args:
             demo_mode: When True, skip external API calls and use stubbed data so the
                 script can run safely without network access.
+            batch_mode: When True, summaries go through the OpenAI Batch API and
+                are collected on a later run instead of being requested inline.
 
         Side Effects:
             - Creates local output and notes directories if they do not exist.
@@ -210,6 +359,12 @@ class DailyAutomation:
         # dependencies are missing. Missing deps are a runtime error unless the
         # user explicitly opts into demo mode.
         self.demo_mode = demo_mode
+        self.batch_mode = batch_mode
+        # Where the last generate_summary() result came from: "api" (including
+        # a batch collected for the current notes), "cache", "batch" (collected
+        # from an earlier batch for different notes),
+        # "pending" (placeholder while a batch runs), "fallback" or "demo".
+        self.summary_source: Optional[str] = None
         self.config = AutomationConfig.load(self.demo_mode, self.project_root)
 
         # If runtime dependencies are not present and the user did not request
@@ -231,13 +386,21 @@ class DailyAutomation:
         self.output_dir = self.config.output_dir
         self.notes_source = self.config.notes_source
 
-        # Ensure directories exist
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.notes_source.mkdir(parents=True, exist_ok=True)
+        # Ensure directories exist. A single stat covers the usual case where
+        # they already do; mkdir would fail with EEXIST and then stat anyway.
+        for directory in (self.output_dir, self.notes_source):
+            if not directory.is_dir():
+                directory.mkdir(parents=True, exist_ok=True)
+
+        self.summary_cache = SummaryCache(
+            self.output_dir / SUMMARY_CACHE_FILE,
+            max_entries=SUMMARY_CACHE_MAX_ENTRIES,
+            ttl_seconds=self.config.cache_ttl_seconds,
+        )
 
         # Initialize clients
-        self.openai_client: Optional[OpenAI] = None
-        self.github_client: Optional[Github] = None
+        self.openai_client: Optional["OpenAI"] = None
+        self.github_client: Optional["Github"] = None
         self.repo = None
 
         if not self.demo_mode:
@@ -284,14 +447,30 @@ class DailyAutomation:
 
         # Initialize API clients
         try:
-            self.openai_client = OpenAI(api_key=self.config.openai_api_key)
+            from openai import OpenAI
+
+            self.openai_client = OpenAI(api_key=self.config.openai_api_key, max_retries=OPENAI_MAX_RETRIES)
         except Exception as e:
             logger.error("❌ Failed to initialize OpenAI client.")
             logger.error("   Verify OPENAI_API_KEY is valid and network access is available.")
             raise RuntimeError("OpenAI client initialization failed") from e
 
+        from github import (
+            Auth,
+            BadCredentialsException,
+            Github,
+            GithubException,
+            GithubRetry,
+            RateLimitExceededException,
+        )
+
         try:
-            self.github_client = Github(auth=Github.Auth.Token(self.config.github_token))
+            self.github_client = Github(
+                auth=Auth.Token(self.config.github_token),
+                # One pooled connection per issue worker, so none is dropped
+                pool_size=max(GITHUB_POOL_SIZE, self.config.issue_concurrency),
+                retry=GithubRetry(total=GITHUB_RETRY_TOTAL, backoff_factor=GITHUB_RETRY_BACKOFF),
+            )
             self.repo = self.github_client.get_repo(self.config.repo_name)
             logger.info(
                 "✓ API clients initialized successfully",
@@ -313,7 +492,7 @@ class DailyAutomation:
             logger.error("   Check that GITHUB_TOKEN has 'repo' scope and REPO_NAME is correct")
             raise RuntimeError("GitHub repository access failed") from e
         except Exception as e:
-            logger.error(f"❌ Failed to initialize GitHub client: {e}")
+            logger.error("❌ Failed to initialize GitHub client: %s", e)
             raise RuntimeError("GitHub client initialization failed") from e
 
     def ingest_notes(self) -> List[str]:
@@ -337,22 +516,78 @@ class DailyAutomation:
         if not notes:
             notes = self._demo_notes()
 
-        logger.info(f"✓ Ingested {len(notes)} notes")
+        logger.info("✓ Ingested %s notes", len(notes))
         return notes
 
     def _read_notes_from_disk(self) -> List[str]:
-        """Read markdown and text notes from the notes directory."""
-        notes = []
-        for pattern in ["**/*.md", "**/*.txt"]:
-            for file_path in self.notes_source.glob(pattern):
-                try:
-                    content = file_path.read_text(encoding="utf-8")
-                    if content.strip():
-                        notes.append(content.strip())
-                        logger.debug(f"  Loaded: {file_path.name}")
-                except Exception as e:
-                    logger.warning(f"  Failed to read {file_path}: {e}")
-        return notes
+        """Read markdown and text notes from the notes directory.
+
+        Larger note sets are read on a small thread pool so per-file
+        open/read latency overlaps instead of accumulating (noticeable on
+        network mounts); a handful of files is read inline.
+        """
+        paths = self._find_note_files()
+        if not paths:
+            return []
+
+        if len(paths) < NOTES_PARALLEL_MIN_FILES:
+            contents = [self._read_note_file(path) for path in paths]
+        else:
+            with ThreadPoolExecutor(max_workers=min(NOTES_READ_WORKERS, len(paths))) as executor:
+                contents = list(executor.map(self._read_note_file, paths))
+
+        return [content for content in contents if content]
+
+    def _find_note_files(self) -> List[Path]:
+        """Collect markdown and text files under the notes directory.
+
+        Walks the tree once with ``os.scandir`` so both extensions are matched
+        in a single pass, using the cached ``DirEntry`` type instead of a
+        ``stat()`` per entry. Paths are returned sorted: scandir order is
+        filesystem-dependent, and a stable note order keeps the prompt, the
+        summary cache key and the audit logs reproducible.
+        """
+        paths: List[Path] = []
+        pending = [str(self.notes_source)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.name.endswith(NOTE_SUFFIXES) and entry.is_file():
+                            paths.append(Path(entry.path))
+            except OSError as e:
+                logger.warning("  Failed to scan %s: %s", e.filename, e)
+        paths.sort()
+        return paths
+
+    def _read_note_file(self, file_path: Path) -> Optional[str]:
+        """Read a single note file, returning its stripped text or None.
+
+        Notes are read whole, so the file is opened unbuffered: a single
+        ``read()`` sized from ``fstat`` skips the BufferedReader layer. Files of
+        ``NOTE_MMAP_MIN_BYTES`` or more are memory-mapped instead.
+        """
+        try:
+            with open(file_path, "rb", buffering=0) as f:
+                if os.fstat(f.fileno()).st_size >= NOTE_MMAP_MIN_BYTES:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        content = decode_mapped_note(mapped)
+                else:
+                    data = f.read()
+                    content = "" if data.isspace() else data.decode("utf-8", errors="replace")
+        except (OSError, ValueError) as e:
+            # ValueError: the file was truncated to empty before it was mapped
+            logger.warning("  Failed to read %s: %s", file_path, e)
+            return None
+
+        content = content.strip()
+        if not content:
+            return None
+
+        logger.debug("  Loaded: %s", file_path.name)
+        return content
 
     def _demo_notes(self) -> List[str]:
         """Return fallback demo notes when no files are available."""
@@ -378,6 +613,7 @@ class DailyAutomation:
             - Logs progress and any API errors.
         """
         logger.info("🤖 Generating summary...")
+        self.summary_source = "demo"
 
         if not notes:
             logger.warning("No notes provided, returning empty summary")
@@ -387,77 +623,322 @@ class DailyAutomation:
             logger.info("  Running in demo mode (stubbed)")
             return self._generate_demo_summary(notes)
 
+        from openai import APIConnectionError, APITimeoutError, APIStatusError, RateLimitError
+
         try:
             notes_text = self._format_notes_for_prompt(notes)
+            cache_key = self._summary_cache_key(notes_text)
+            collected = None
+            if self.batch_mode:
+                pending = self._load_pending_batch()
+                try:
+                    collected = self._collect_pending_batch(pending) if pending else None
+                except Exception as e:
+                    # Keep the batch recorded and daily_summary.json as it is;
+                    # the next --batch run retries the collection.
+                    logger.error("❌ Could not collect OpenAI batch %s: %s", pending["batch_id"], e)
+                    logger.error("   The batch is kept and collected on the next --batch run.")
+                    self.summary_source = "pending"
+                    return self._batch_placeholder(pending["batch_id"])
+                if collected is not None and pending.get("cache_key") == cache_key:
+                    # The batch answered these exact notes, so it is current
+                    # whatever the cache TTL; resubmitting would only repeat it.
+                    self.summary_source = "api"
+                    return collected
+            cached = self.summary_cache.get(cache_key)
+            if cached is not None:
+                logger.info("✓ Notes unchanged, reusing cached summary")
+                self.summary_source = "cache"
+                return cached
+
+            embedding = self._embed_notes(notes_text) if self.config.semantic_cache else None
+            if embedding is not None:
+                similar = self.summary_cache.find_similar(embedding, SUMMARY_SIMILARITY_THRESHOLD)
+                if similar is not None:
+                    logger.info("✓ Notes nearly unchanged, reusing cached summary")
+                    self.summary_source = "cache"
+                    return similar
+
             prompt = self._build_summary_prompt(notes_text)
+            if self.batch_mode:
+                placeholder = self._submit_summary_batch(prompt, cache_key)
+                if collected is not None:
+                    # The finished batch answered earlier notes; publish it
+                    # now rather than dropping it while today's batch runs.
+                    logger.info("  Publishing the summary collected from the earlier batch")
+                    self.summary_source = "batch"
+                    return collected
+                self.summary_source = "pending"
+                return placeholder
             response = self._request_summary(prompt)
-            return self._parse_summary_response(response)
+            summary = self._parse_summary_response(response)
+            if summary.get("assessment") != NON_JSON_ASSESSMENT:
+                self.summary_cache.store(cache_key, summary, embedding)
+            self.summary_source = "api"
+            return summary
         except RateLimitError as e:
             logger.error("❌ OpenAI rate limit reached while generating summary.")
             logger.error("   Wait before retrying or reduce request volume.")
-            logger.debug(f"OpenAI rate limit details: {e}")
+            logger.debug("OpenAI rate limit details: %s", e)
         except APITimeoutError as e:
             logger.error("❌ OpenAI request timed out while generating summary.")
             logger.error("   Check network connectivity or try again with fewer notes.")
-            logger.debug(f"OpenAI timeout details: {e}")
+            logger.debug("OpenAI timeout details: %s", e)
         except APIConnectionError as e:
             logger.error("❌ Unable to reach OpenAI (network or DNS issue).")
             logger.error("   Verify internet access and any proxy/firewall settings.")
-            logger.debug(f"OpenAI connection details: {e}")
+            logger.debug("OpenAI connection details: %s", e)
         except APIStatusError as e:
-            logger.error(f"❌ OpenAI returned an error response (status {getattr(e, 'status_code', 'unknown')}).")
+            logger.error("❌ OpenAI returned an error response (status %s).", getattr(e, "status_code", "unknown"))
             logger.error("   Review API key permissions or retry later if this is a service issue.")
-            logger.debug(f"OpenAI status error details: {e}")
+            logger.debug("OpenAI status error details: %s", e)
         except Exception as e:
-            logger.error(f"OpenAI API error: {e}")
+            logger.error("OpenAI API error: %s", e)
 
         logger.info("  Falling back to demo summary")
+        self.summary_source = "fallback"
         return self._generate_demo_summary(notes)
 
     def _format_notes_for_prompt(self, notes: List[str]) -> str:
-        """Format notes into a numbered list suitable for prompts."""
-        return "\n".join(f"{i+1}. {note}" for i, note in enumerate(notes))
+        """Format notes into a numbered list suitable for prompts.
+
+        Note text is limited to ``NOTES_PROMPT_MAX_CHARS`` in total: the note
+        that crosses the budget is truncated and any later notes are dropped,
+        with a warning naming them.
+        """
+        buf = io.StringIO()
+        write = buf.write
+        remaining = NOTES_PROMPT_MAX_CHARS
+        for i, note in enumerate(notes, 1):
+            if i > 1:
+                write("\n")
+            write(str(i))
+            write(". ")
+            if len(note) <= remaining:
+                write(note)
+                remaining -= len(note)
+                continue
+
+            write(note[:remaining])
+            write(NOTE_TRUNCATED_MARKER)
+            logger.warning(
+                "⚠️  Note %s truncated to fit the prompt budget (%s of %s characters kept)", i, remaining, len(note)
+            )
+            if i < len(notes):
+                logger.warning(
+                    "⚠️  Notes %s-%s dropped: prompt budget of %s characters reached",
+                    i + 1, len(notes), NOTES_PROMPT_MAX_CHARS,
+                )
+            break
+        return buf.getvalue()
 
     def _build_summary_prompt(self, notes_text: str) -> str:
         """Construct the prompt used for OpenAI summary generation."""
-        return (
-            "Analyze these daily notes and provide a structured summary:\n\n"
-            f"{notes_text}\n\n"
-            "Extract:\n"
-            "1. Key highlights (2-4 bullet points)\n"
-            "2. Action items with priorities\n"
-            "3. Brief overall assessment\n\n"
-            "Format as JSON with keys: highlights, action_items, assessment"
-        )
+        return SUMMARY_INSTRUCTIONS + notes_text
+
+    def _summary_request_body(self, prompt: str) -> Dict[str, Any]:
+        """Return the chat completion parameters for a summary request.
+
+        Highlights, action items and the assessment come back from a single
+        completion in JSON mode, so the model cannot answer in prose; the
+        non-JSON fallback in ``_parse_summary_response`` only covers replies
+        cut off by ``max_tokens``.
+        """
+        return {
+            "model": OPENAI_SUMMARY_MODEL,
+            "messages": [
+                {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            "response_format": {"type": "json_object"},
+            "temperature": OPENAI_SUMMARY_TEMPERATURE,
+            "max_tokens": 500,
+        }
 
     def _request_summary(self, prompt: str) -> Any:
         """Call the OpenAI API to generate a summary."""
         return self.openai_client.chat.completions.create(
-            model="gpt-4-turbo-preview",
-            messages=[
-                {"role": "system", "content": "You are a helpful assistant that summarizes daily work notes."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=500,
+            **self._summary_request_body(prompt),
             timeout=30.0,
         )
 
+    def _submit_summary_batch(self, prompt: str, cache_key: str) -> Dict[str, Any]:
+        """Submit the summary request to the OpenAI Batch API.
+
+        Batch requests cost half as much and draw on a separate rate-limit
+        pool, but complete within 24 hours rather than inline. The batch id is
+        recorded in ``PENDING_BATCH_FILE``; a later ``--batch`` run collects the
+        result into the summary cache. Until then this run gets a placeholder
+        summary with no action items, which ``run`` does not publish.
+        """
+        pending = self._load_pending_batch()
+        if pending and pending.get("cache_key") == cache_key:
+            batch_id = pending["batch_id"]
+            logger.info("  Summary already submitted in OpenAI batch %s", batch_id)
+        else:
+            if pending:
+                logger.warning("⚠️  Notes changed; cancelling pending OpenAI batch %s", pending["batch_id"])
+                try:
+                    self.openai_client.batches.cancel(pending["batch_id"])
+                except Exception as e:
+                    logger.warning("  Could not cancel OpenAI batch %s: %s", pending["batch_id"], e)
+            request = {
+                "custom_id": cache_key,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._summary_request_body(prompt),
+            }
+            batch_input = self.openai_client.files.create(
+                file=("summary_batch.jsonl", json.dumps(request, ensure_ascii=False).encode("utf-8")),
+                purpose="batch",
+            )
+            batch = self.openai_client.batches.create(
+                input_file_id=batch_input.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+            batch_id = batch.id
+            pending = {
+                "batch_id": batch_id,
+                "cache_key": cache_key,
+                "submitted_at": datetime.now(timezone.utc).isoformat(),
+            }
+            (self.output_dir / PENDING_BATCH_FILE).write_bytes(dump_json_bytes(pending))
+            logger.info("✓ Submitted summary to OpenAI batch %s", batch_id)
+
+        return self._batch_placeholder(batch_id)
+
+    def _batch_placeholder(self, batch_id: str) -> Dict[str, Any]:
+        """Return the summary published while OpenAI batch ``batch_id`` runs."""
+        return {
+            "highlights": [],
+            "action_items": [],
+            "assessment": BATCH_PENDING_ASSESSMENT.format(batch_id=batch_id),
+        }
+
+    def _load_pending_batch(self) -> Optional[Dict[str, Any]]:
+        """Return the recorded pending batch, or None if there is none."""
+        pending_file = self.output_dir / PENDING_BATCH_FILE
+        try:
+            pending = load_json(pending_file.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("  Ignoring unreadable pending batch file %s: %s", pending_file, e)
+            return None
+        if not isinstance(pending, dict) or "batch_id" not in pending:
+            return None
+        return pending
+
+    def _collect_pending_batch(self, pending: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Move a finished OpenAI batch result into the summary cache.
+
+        Batches that are still running are left in place. Batches that failed,
+        expired, were cancelled or no longer exist (e.g. after an API key or
+        organization change) are dropped so the next submission starts fresh.
+        A completed batch stays recorded until its summary has been stored, so
+        a failed download or parse is retried by the next run.
+
+        Args:
+            pending: The record loaded by ``_load_pending_batch``
+
+        Returns:
+            The collected summary, or None if nothing was collected
+        """
+        from openai import NotFoundError
+
+        pending_file = self.output_dir / PENDING_BATCH_FILE
+        try:
+            batch = self.openai_client.batches.retrieve(pending["batch_id"])
+        except NotFoundError:
+            logger.warning("⚠️  OpenAI batch %s no longer exists; it will be resubmitted", pending["batch_id"])
+            pending_file.unlink(missing_ok=True)
+            return None
+        if batch.status in BATCH_ACTIVE_STATUSES:
+            logger.info("  OpenAI batch %s is %s", batch.id, batch.status)
+            return None
+
+        if batch.status != "completed" or not batch.output_file_id:
+            logger.warning("⚠️  OpenAI batch %s ended with status %s; it will be resubmitted", batch.id, batch.status)
+            pending_file.unlink(missing_ok=True)
+            return None
+
+        from openai.types.chat import ChatCompletion
+
+        output = self.openai_client.files.content(batch.output_file_id).content
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            result = load_json(line)
+            response = result.get("response") or {}
+            if result.get("custom_id") != pending.get("cache_key") or response.get("status_code") != 200:
+                continue
+            summary = self._parse_summary_response(ChatCompletion.model_validate(response["body"]))
+            if summary.get("assessment") != NON_JSON_ASSESSMENT:
+                self.summary_cache.store(pending["cache_key"], summary)
+            pending_file.unlink(missing_ok=True)
+            logger.info("✓ Collected summary from OpenAI batch %s", batch.id)
+            return summary
+
+        logger.warning("⚠️  OpenAI batch %s completed without a usable summary", batch.id)
+        pending_file.unlink(missing_ok=True)
+        return None
+
     def _parse_summary_response(self, response: Any) -> Dict[str, Any]:
         """Parse the OpenAI response into structured summary data."""
-        content = response.choices[0].message.content
+        choice = response.choices[0]
+        content = choice.message.content or ""
         try:
-            summary_data = json.loads(content)
-        except json.JSONDecodeError:
+            summary_data = load_json(content)
+        except ValueError as e:
+            # JSON mode makes this rare (usually a reply cut off at max_tokens);
+            # say so loudly and keep the whole reply rather than a 200-char stub.
+            finish_reason = getattr(choice, "finish_reason", None)
+            logger.warning("⚠️  OpenAI reply was not valid JSON (finish_reason=%s): %s", finish_reason, e)
+            logger.warning("   Keeping the raw reply as a single highlight; review the generated summary.")
             summary_data = {
-                "highlights": [content[:200]],
+                "highlights": [content],
                 "action_items": ["Review generated summary"],
-                "assessment": "AI generated summary (non-JSON response)"
+                "assessment": NON_JSON_ASSESSMENT
             }
 
-        logger.info(f"✓ Generated summary using {response.model}")
+        logger.info("✓ Generated summary using %s", response.model)
         return summary_data
 
+    def _summary_cache_key(self, notes_text: str) -> str:
+        """Return the summary cache key for a formatted notes block.
+
+        The model and temperature are part of the key so changing either one
+        never serves a summary produced under the old settings.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{OPENAI_SUMMARY_MODEL}\0{OPENAI_SUMMARY_TEMPERATURE}\0".encode("utf-8"))
+        digest.update(notes_text.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _embed_notes(self, notes_text: str) -> Optional[List[float]]:
+        """Embed the formatted notes for semantic cache lookups.
+
+        Failures only disable the semantic lookup for this run; the summary
+        request itself still goes ahead. Notes longer than
+        ``SUMMARY_EMBEDDING_MAX_CHARS`` are not embedded.
+        """
+        if len(notes_text) > SUMMARY_EMBEDDING_MAX_CHARS:
+            logger.info(
+                "  Notes exceed %s characters; skipping the semantic cache lookup", SUMMARY_EMBEDDING_MAX_CHARS
+            )
+            return None
+        try:
+            response = self.openai_client.embeddings.create(
+                model=SUMMARY_EMBEDDING_MODEL,
+                input=notes_text,
+                timeout=30.0,
+            )
+        except Exception as e:
+            logger.warning("  Could not embed notes for the semantic cache: %s", e)
+            return None
+        return response.data[0].embedding
+
     def _generate_demo_summary(self, notes: List[str]) -> Dict[str, Any]:
         """Generate a demo summary without API calls"""
         return {
@@ -474,11 +955,12 @@ class DailyAutomation:
             "assessment": "Key outcomes: 3 actionable items identified. Sales pipeline automation is high-priority."
         }
 
-    def create_github_issues(self, action_items: List[str]) -> List[Dict[str, Any]]:
+    def create_github_issues(self, action_items: List[str], created_at: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """Create GitHub issues for each action item.
 
         Args:
             action_items: List of action item strings from the summary.
+            created_at: Timestamp recorded in each issue body (defaults to now).
 
         Returns:
             A list of dicts describing the created or demo issues (with ``number``, ``title``, ``url``, ``labels``).
@@ -498,51 +980,28 @@ class DailyAutomation:
             logger.info("  Running in demo mode (stubbed)")
             return self._demo_issues(action_items)
 
-        for item in action_items:
-            try:
-                # Skip invalid items (None, empty, or whitespace-only)
-                if item is None or not str(item).strip():
-                    logger.warning(f"  Skipping empty or invalid action item")
-                    continue
-                    
-                issue = self._create_issue_from_item(str(item))
-                created_issues.append({
-                    "number": issue.number,
-                    "title": issue.title,
-                    "url": issue.html_url,
-                    "labels": [label.name for label in issue.labels],
-                })
-                logger.info(f"  Created issue #{issue.number}: {issue.title}")
-            except ValueError as e:
-                logger.warning(f"Skipping invalid action item: {e}")
-                continue
-            except RateLimitExceededException as e:
-                logger.error(f"❌ GitHub rate limit reached while creating issue for: {item[:50]}...")
-                # Additional context from remote branch: include reset time if available
-                try:
-                    reset_time = e.data.get('reset', 'unknown')
-                except Exception:
-                    reset_time = 'unknown'
-                logger.error(f"   Rate limit resets at: {reset_time}")
-                logger.error("   Wait before retrying or reduce request volume.")
-                logger.debug(f"GitHub rate limit details: {e}")
-            except UnknownObjectException as e:
-                logger.error(f"❌ Repository or resource not found: {self.config.repo_name}")
-                logger.error("   Verify the GITHUB_REPO environment variable is correct.")
-                logger.debug(f"GitHub unknown object details: {e}")
-            except BadCredentialsException as e:
-                logger.error("❌ GitHub authentication failed (invalid or expired PAT).")
-                logger.error("   Verify GITHUB_TOKEN has correct permissions.")
-                logger.debug(f"GitHub credentials error details: {e}")
-            except GithubException as e:
-                logger.error(f"❌ GitHub API error creating issue for: {item[:50]}...")
-                logger.error(f"   Status: {e.status}, Message: {e.data.get('message', str(e))}")
-                logger.debug(f"GitHub exception details: {e}")
-            except Exception as e:
-                logger.error(f"Unexpected error creating issue: {e}")
-                logger.info("  Continuing with partial results...")
-
-        logger.info(f"✓ Created {len(created_issues)} GitHub issues")
+        # Skip invalid items (None, empty, or whitespace-only) up front so the
+        # worker pool only sees items that become API calls.
+        valid_items = [text for item in action_items if item is not None and (text := str(item)).strip()]
+        skipped = len(action_items) - len(valid_items)
+        if skipped:
+            logger.warning("  Skipping %s empty or invalid action items", skipped)
+
+        if valid_items:
+            created = (created_at or datetime.now(timezone.utc)).isoformat()
+
+            # Each create_issue is a blocking HTTPS round-trip. With
+            # GH_ISSUE_CONCURRENCY > 1 they overlap on a small pool; map()
+            # keeps results in action-item order either way.
+            workers = min(self.config.issue_concurrency, len(valid_items))
+            if workers == 1:
+                results = list(map(self._create_issue_logged, valid_items, repeat(created)))
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    results = list(executor.map(self._create_issue_logged, valid_items, repeat(created)))
+            created_issues = [issue for issue in results if issue is not None]
+
+        logger.info("✓ Created %s GitHub issues", len(created_issues))
         return created_issues
 
     def _demo_issues(self, action_items: List[str]) -> List[Dict[str, Any]]:
@@ -558,21 +1017,68 @@ class DailyAutomation:
             for i, item in enumerate(action_items)
         ]
 
-    def _create_issue_from_item(self, item_text: str) -> Any:
-        """Create a single GitHub issue from an action item string."""
-        if not item_text or not item_text.strip():
-            raise ValueError("Cannot create issue from empty action item")
+    def _create_issue_logged(self, item: str, created_at: str) -> Optional[Dict[str, Any]]:
+        """Create one issue, logging failures instead of raising.
+
+        Runs on the issue worker pool, so every error is handled here and
+        reported as ``None`` rather than aborting the other creations.
+        """
+        from github import (
+            BadCredentialsException,
+            GithubException,
+            RateLimitExceededException,
+            UnknownObjectException,
+        )
+
+        try:
+            issue = self._create_issue_from_item(item, created_at)
+            logger.info("  Created issue #%s: %s", issue.number, issue.title)
+            return {
+                "number": issue.number,
+                "title": issue.title,
+                "url": issue.html_url,
+                "labels": [label.name for label in issue.labels],
+            }
+        except ValueError as e:
+            logger.warning("Skipping invalid action item: %s", e)
+        except RateLimitExceededException as e:
+            logger.error("❌ GitHub rate limit reached while creating issue for: %s...", item[:50])
+            # Additional context from remote branch: include reset time if available
+            try:
+                reset_time = e.data.get('reset', 'unknown')
+            except Exception:
+                reset_time = 'unknown'
+            logger.error("   Rate limit resets at: %s", reset_time)
+            logger.error("   Wait before retrying or reduce request volume.")
+            logger.debug("GitHub rate limit details: %s", e)
+        except UnknownObjectException as e:
+            logger.error("❌ Repository or resource not found: %s", self.config.repo_name)
+            logger.error("   Verify the GITHUB_REPO environment variable is correct.")
+            logger.debug("GitHub unknown object details: %s", e)
+        except BadCredentialsException as e:
+            logger.error("❌ GitHub authentication failed (invalid or expired PAT).")
+            logger.error("   Verify GITHUB_TOKEN has correct permissions.")
+            logger.debug("GitHub credentials error details: %s", e)
+        except GithubException as e:
+            logger.error("❌ GitHub API error creating issue for: %s...", item[:50])
+            logger.error("   Status: %s, Message: %s", e.status, e.data.get("message", str(e)))
+            logger.debug("GitHub exception details: %s", e)
+        except Exception as e:
+            logger.error("Unexpected error creating issue: %s", e)
+            logger.info("  Continuing with partial results...")
+        return None
 
-        # Ensure title is not empty after stripping
+    def _create_issue_from_item(self, item_text: str, created_at: str) -> Any:
+        """Create a single GitHub issue from an action item string."""
+        # Ensure title is not empty after stripping; the full text is only
+        # re-checked to pick the error message
         title = item_text[:100].strip()
         if not title:
+            if not item_text.strip():
+                raise ValueError("Cannot create issue from empty action item")
             raise ValueError("Action item results in empty title after processing")
-            
-        body = (
-            f"Auto-generated from daily automation runner\n\n"
-            f"**Action Item:**\n{item_text}\n\n"
-            f"---\n*Created: {datetime.now(timezone.utc).isoformat()}*"
-        )
+
+        body = ISSUE_BODY_TEMPLATE.format(item=item_text, created_at=created_at)
         return self.repo.create_issue(title=title, body=body, labels=["automation", "daily-runner"])
 
     def pull_sales_pipeline_data(self) -> Optional[Dict[str, Any]]:
@@ -602,30 +1108,37 @@ class DailyAutomation:
             # Pull data
             pipeline_data = pipeline_source.pull_data()
             
-            # Save to main output file
+            # Save to main output file; the cache copy reuses the same bytes
+            pipeline_dict = pipeline_data.to_dict()
+            payload = dump_json_bytes(pipeline_dict)
             pipeline_file = self.output_dir / "sales_pipeline.json"
-            pipeline_file.write_text(
-                json.dumps(pipeline_data.to_dict(), indent=2),
-                encoding="utf-8"
-            )
-            logger.info(f"  Saved: {pipeline_file}")
+            pipeline_file.write_bytes(payload)
+            logger.info("  Saved: %s", pipeline_file)
             
             # Save to cache
             try:
-                cache_file = pipeline_source.save_to_cache(pipeline_data)
-                logger.debug(f"  Cached: {cache_file}")
+                cache_file = pipeline_source.save_to_cache(pipeline_data, payload)
+                logger.debug("  Cached: %s", cache_file)
             except Exception as e:
-                logger.warning(f"Failed to cache pipeline data: {e}")
+                logger.warning("Failed to cache pipeline data: %s", e)
             
             logger.info("✓ Sales pipeline data pull complete")
-            return pipeline_data.to_dict()
+            return pipeline_dict
             
         except Exception as e:
-            logger.error(f"Failed to pull sales pipeline data: {e}")
+            logger.error("Failed to pull sales pipeline data: %s", e)
             logger.debug("Sales pipeline pull error details:", exc_info=True)
             return None
 
-    def save_output(self, notes: List[str], summary: Dict[str, Any], issues: List[Dict[str, Any]], pipeline_data: Optional[Dict[str, Any]] = None) -> Path:
+    def save_output(
+        self,
+        notes: List[str],
+        summary: Dict[str, Any],
+        issues: List[Dict[str, Any]],
+        pipeline_data: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[datetime] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> Path:
         """Save the daily run's output to a timestamped JSON file.
 
         Args:
@@ -633,6 +1146,10 @@ class DailyAutomation:
             summary: The structured summary generated from notes.
             issues: List of GitHub issues created from action items.
             pipeline_data: Optional sales pipeline data.
+            timestamp: Run timestamp for ``date``/``created_at`` and the audit
+                log name (defaults to now).
+            idempotency_key: Recorded so a same-day re-run on the same notes
+                can be skipped (see ``_run_idempotency_key``).
 
         Returns:
             The absolute Path to the saved output file.
@@ -644,7 +1161,10 @@ class DailyAutomation:
         """
         logger.info("💾 Saving output...")
 
-        timestamp = datetime.now(timezone.utc)
+        timestamp = timestamp or datetime.now(timezone.utc)
+        run_date = timestamp.strftime("%Y-%m-%d")
+        created_at = timestamp.isoformat()
+        audit_stamp = timestamp.strftime("%Y%m%d_%H%M%S")
         
         # Handle potential None values in summary with defensive programming
         highlights = summary.get("highlights") or []
@@ -655,23 +1175,24 @@ class DailyAutomation:
         highlights = [s for h in highlights if h is not None and (s := str(h).strip())]
         action_items = [s for item in action_items if item is not None and (s := str(item).strip())]
         
-        # Build raw_text with proper handling of empty action items
-        raw_text_parts = [f"Summary:\n{assessment}"]
+        # Build raw_text line by line and join once, with a placeholder when
+        # there are no action items
+        raw_text_lines = ["Summary:", assessment, "Actions:"]
         if action_items:
-            raw_text_parts.append("\nActions:\n" + "\n".join(f"- {item}" for item in action_items))
+            raw_text_lines.extend([f"- {item}" for item in action_items])
         else:
-            raw_text_parts.append("\nActions:\n(No action items)")
+            raw_text_lines.append("(No action items)")
         
         output_data = {
-            "date": timestamp.strftime("%Y-%m-%d"),
-            "created_at": timestamp.isoformat(),
+            "date": run_date,
+            "created_at": created_at,
             "repo": self.config.repo_name or "unknown/repo",
             "summary_bullets": highlights,
             "action_items": action_items,
             "assessment": assessment,
             "issues_created": len(issues),
             "issues": issues,
-            "raw_text": "".join(raw_text_parts),
+            "raw_text": "\n".join(raw_text_lines),
             "metadata": {
                 "runner_version": "2.0.0",
                 "demo_mode": self.demo_mode,
@@ -689,15 +1210,41 @@ class DailyAutomation:
                 "timestamp": pipeline_data.get("timestamp", ""),
             }
 
-        # Save main output
-        output_file = self.output_dir / "daily_summary.json"
-        output_file.write_text(json.dumps(output_data, indent=2, ensure_ascii=False), encoding="utf-8")
-        logger.info(f"  Saved: {output_file}")
+        if idempotency_key:
+            output_data["idempotency_key"] = idempotency_key
 
-        # Save audit log
-        log_file = self.output_dir / f"audit_{timestamp.strftime('%Y%m%d_%H%M%S')}.json"
-        log_file.write_text(json.dumps(output_data, indent=2, ensure_ascii=False), encoding="utf-8")
-        logger.info(f"  Saved: {log_file}")
+        # Serialize once; the audit log is a byte-identical copy. With
+        # COMPACT_JSON set, daily_summary.json is written without whitespace
+        # and the (human-inspected) audit log keeps its own indented copy.
+        payload = dump_json_bytes(output_data)
+        summary_payload = dump_json_bytes(output_data, compact=True) if self.config.compact_json else payload
+
+        # Save main output. Written to a temp file and renamed into place so
+        # the previous run's inode (still linked from its audit log) is never
+        # modified.
+        output_file = self.output_dir / "daily_summary.json"
+        tmp_file = output_file.with_name(f".{output_file.name}.tmp")
+        tmp_file.write_bytes(summary_payload)
+        os.replace(tmp_file, output_file)
+        logger.info("  Saved: %s", output_file)
+
+        # Save audit log. With AUDIT_GZIP set it is compressed (level 1: the
+        # win is bytes on disk, not ratio); otherwise it is a hard link to the
+        # same bytes, copying where links are unsupported (other filesystem,
+        # existing file, Windows shares).
+        log_file = self.output_dir / f"audit_{audit_stamp}.json"
+        if self.config.gzip_audit:
+            log_file = log_file.with_suffix(".json.gz")
+            with gzip.open(log_file, "wb", compresslevel=1) as f:
+                f.write(payload)
+        elif summary_payload is not payload:
+            log_file.write_bytes(payload)
+        else:
+            try:
+                os.link(output_file, log_file)
+            except OSError:
+                log_file.write_bytes(payload)
+        logger.info("  Saved: %s", log_file)
 
         logger.info("✓ Output saved successfully")
         return output_file
@@ -708,16 +1255,21 @@ class DailyAutomation:
         run_id: str,
         started_at: datetime,
         ended_at: datetime,
+        duration: float,
         status: str,
         steps: List[RunStepRecord],
         artifacts: Dict[str, str],
     ) -> Path:
-        """Persist a run-level summary (run.json) for inspection and auditing."""
+        """Persist a run-level summary (run.json) for inspection and auditing.
+
+        ``duration`` is measured on the monotonic clock by the caller, so it
+        stays correct even if the wall clock is adjusted mid-run.
+        """
         run_summary = {
             "run_id": run_id,
             "started_at": started_at.isoformat(),
             "ended_at": ended_at.isoformat(),
-            "duration_sec": round((ended_at - started_at).total_seconds(), 2),
+            "duration_sec": round(duration, 2),
             "status": status,
             "demo_mode": self.demo_mode,
             "steps": steps,
@@ -730,7 +1282,7 @@ class DailyAutomation:
             encoding="utf-8",
         )
 
-        logger.info(f"📄 Saved run summary: {run_file}")
+        logger.info("📄 Saved run summary: %s", run_file)
         return run_file
 
     def run(self) -> int:
@@ -739,9 +1291,9 @@ class DailyAutomation:
         Steps performed:
             1. Ingest notes from configured source.
             2. Generate summary (using OpenAI or demo fallback).
-            3. Pull sales pipeline data (new feature).
+            3. Pull sales pipeline data (in the background, alongside steps 2 and 4).
             4. Create GitHub issues from action items (skipped in demo mode).
-            5. Save outputs to disk.
+            5. Save outputs to disk (skipped while a --batch summary is pending).
 
         Returns:
             0 on success, 1 on failure.
@@ -751,8 +1303,9 @@ class DailyAutomation:
             - Creates GitHub issues (when not in demo).
             - Saves output JSON files to the ``output/`` directory.
         """
-        run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
         started_at = datetime.now(timezone.utc)
+        start_clock = time.monotonic()
+        run_id = started_at.strftime("%Y%m%dT%H%M%S")
 
         logger.info(
             "RUN_START",
@@ -782,6 +1335,7 @@ class DailyAutomation:
                         run_id=run_id,
                         started_at=started_at,
                         ended_at=ended_at,
+                        duration=time.monotonic() - start_clock,
                         status="failed",
                         steps=steps,
                         artifacts=artifacts,
@@ -800,42 +1354,69 @@ class DailyAutomation:
                     run_id=run_id,
                     started_at=started_at,
                     ended_at=ended_at,
+                    duration=time.monotonic() - start_clock,
+                    status="success",
+                    steps=steps,
+                    artifacts=artifacts,
+                )
+                return 0
+
+            # ── IDEMPOTENCY ────────────────────────────────────────
+            # A live run that already completed today on these exact notes
+            # has created its issues; running again would only duplicate them.
+            idempotency_key = None if self.demo_mode else self._run_idempotency_key(notes, started_at)
+            if idempotency_key and not self.config.force_run and self._already_processed(idempotency_key):
+                logger.info(
+                    "✓ Notes already processed today; skipping run (set FORCE_RUN=1 to rerun)",
+                    extra={"run_id": run_id}
+                )
+                steps.append({"stage": "ingest", "step": "idempotency-check", "status": "skipped"})
+                self._write_run_summary(
+                    run_id=run_id,
+                    started_at=started_at,
+                    ended_at=datetime.now(timezone.utc),
+                    duration=time.monotonic() - start_clock,
                     status="success",
                     steps=steps,
                     artifacts=artifacts,
                 )
                 return 0
 
+            # ── OPTIONAL DATA ENRICHMENT ───────────────────────────
+            # The sales pipeline pull does not depend on the summary or on
+            # issue creation, so start it now and collect it before saving.
+            executor = ThreadPoolExecutor(max_workers=1)
+            enrich_future = executor.submit(
+                run_step,
+                run_id=run_id,
+                stage="enrich",
+                step="sales-pipeline",
+                fn=self.pull_sales_pipeline_data,
+                allow_failure=True,
+            )
+            executor.shutdown(wait=False)
+
             # ── TRANSFORM ──────────────────────────────────────────
             ok, summary = run_step(
                 run_id=run_id,
                 stage="transform",
                 step="generate-summary",
-                fn=lambda: self._build_summary(notes),
+                fn=lambda: self.generate_summary(notes),
                 allow_failure=True,
             )
             steps.append({"stage": "transform", "step": "generate-summary", "status": "success" if ok else "failure"})
 
             if not ok:
                 overall_failed = True
+                self.summary_source = "fallback"
                 summary = self._generate_demo_summary(notes)
 
-            # ── OPTIONAL DATA ENRICHMENT ───────────────────────────
-            ok_enrich, pipeline_data = run_step(
-                run_id=run_id,
-                stage="enrich",
-                step="sales-pipeline",
-                fn=self.pull_sales_pipeline_data,
-                allow_failure=True,
-            )
-            steps.append({"stage": "enrich", "step": "sales-pipeline", "status": "success" if ok_enrich else "failure"})
-
             # ── OUTPUT / SIDE EFFECTS ──────────────────────────────
             ok_issues, issues = run_step(
                 run_id=run_id,
                 stage="output",
                 step="github-issues",
-                fn=lambda: self._handle_issues(summary),
+                fn=lambda: self._handle_issues(summary, started_at),
                 allow_failure=True,
             )
             steps.append({"stage": "output", "step": "github-issues", "status": "success" if ok_issues else "failure"})
@@ -844,44 +1425,74 @@ class DailyAutomation:
                 overall_failed = True
                 issues = []
 
-            try:
-                ok_save, output_file = run_step(
-                    run_id=run_id,
-                    stage="output",
-                    step="save-output",
-                    fn=lambda: self.save_output(
-                        notes,
-                        summary,
-                        issues,
-                        pipeline_data,
-                    ),
-                    allow_failure=False,  # must always persist outputs
+            # Only a clean run may short-circuit later runs: the summary must
+            # be a model summary of these notes (fresh or cached, including a
+            # collected batch), and every action item must have become an
+            # issue. Fallback, non-JSON, pending or stale-batch summaries and
+            # issue failures (reported per item, not as a step failure) are
+            # retried by the next run.
+            if idempotency_key:
+                expected_issues = sum(
+                    1 for item in summary.get("action_items") or [] if item is not None and str(item).strip()
                 )
-                steps.append({"stage": "output", "step": "save-output", "status": "success" if ok_save else "failure"})
-                # record artifact
-                try:
-                    artifacts["daily_summary"] = str(output_file)
-                except Exception:
-                    logger.debug("Could not record artifact path", exc_info=True)
-            except Exception as e:
-                steps.append({"stage": "output", "step": "save-output", "status": "failure", "error": str(e)})
-                ended_at = datetime.now(timezone.utc)
+                if (
+                    overall_failed
+                    or self.summary_source not in ("api", "cache")
+                    or summary.get("assessment") == NON_JSON_ASSESSMENT
+                    or len(issues) < expected_issues
+                ):
+                    idempotency_key = None
+
+            ok_enrich, pipeline_data = enrich_future.result()
+            steps.append({"stage": "enrich", "step": "sales-pipeline", "status": "success" if ok_enrich else "failure"})
+
+            # A batch placeholder has no content yet; keep the last published
+            # summary until the batch is collected.
+            if self.summary_source == "pending":
+                logger.info("  Summary pending in an OpenAI batch; leaving daily_summary.json unchanged")
+                steps.append({"stage": "output", "step": "save-output", "status": "skipped"})
+            else:
                 try:
-                    self._write_run_summary(
+                    ok_save, output_file = run_step(
                         run_id=run_id,
-                        started_at=started_at,
-                        ended_at=ended_at,
-                        status="failed",
-                        steps=steps,
-                        artifacts=artifacts,
+                        stage="output",
+                        step="save-output",
+                        fn=lambda: self.save_output(
+                            notes,
+                            summary,
+                            issues,
+                            pipeline_data,
+                            timestamp=started_at,
+                            idempotency_key=idempotency_key,
+                        ),
+                        allow_failure=False,  # must always persist outputs
                     )
-                except Exception:
-                    logger.debug("Failed to persist run summary after save-output failure", exc_info=True)
-                raise
+                    steps.append({"stage": "output", "step": "save-output", "status": "success" if ok_save else "failure"})
+                    # record artifact
+                    try:
+                        artifacts["daily_summary"] = str(output_file)
+                    except Exception:
+                        logger.debug("Could not record artifact path", exc_info=True)
+                except Exception as e:
+                    steps.append({"stage": "output", "step": "save-output", "status": "failure", "error": str(e)})
+                    ended_at = datetime.now(timezone.utc)
+                    try:
+                        self._write_run_summary(
+                            run_id=run_id,
+                            started_at=started_at,
+                            ended_at=ended_at,
+                            duration=time.monotonic() - start_clock,
+                            status="failed",
+                            steps=steps,
+                            artifacts=artifacts,
+                        )
+                    except Exception:
+                        logger.debug("Failed to persist run summary after save-output failure", exc_info=True)
+                    raise
 
             # ── FINALIZATION ───────────────────────────────────────
             ended_at = datetime.now(timezone.utc)
-            duration = (ended_at - started_at).total_seconds()
+            duration = time.monotonic() - start_clock
 
             logger.info(
                 "RUN_COMPLETE",
@@ -901,6 +1512,7 @@ class DailyAutomation:
                     run_id=run_id,
                     started_at=started_at,
                     ended_at=ended_at,
+                    duration=duration,
                     status="partial" if overall_failed else "success",
                     steps=steps,
                     artifacts=artifacts,
@@ -921,6 +1533,7 @@ class DailyAutomation:
                     run_id=run_id,
                     started_at=started_at,
                     ended_at=ended_at,
+                    duration=time.monotonic() - start_clock,
                     status="failed",
                     steps=steps,
                     artifacts=artifacts,
@@ -935,28 +1548,51 @@ class DailyAutomation:
             )
             return 1
 
+    def _run_idempotency_key(self, notes: List[str], started_at: datetime) -> str:
+        """Return a key for this run's inputs: the UTC run date and the notes.
+
+        The raw notes are hashed (length-prefixed, so note boundaries count)
+        rather than the formatted prompt, which would repeat the formatting
+        and its budget warnings that ``generate_summary`` already does.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{started_at.strftime('%Y-%m-%d')}\0".encode("utf-8"))
+        for note in notes:
+            encoded = note.encode("utf-8")
+            digest.update(f"{len(encoded)}\0".encode("ascii"))
+            digest.update(encoded)
+        return digest.hexdigest()
+
+    def _already_processed(self, idempotency_key: str) -> bool:
+        """Return True if daily_summary.json was written by a run with this key."""
+        summary_file = self.output_dir / "daily_summary.json"
+        try:
+            existing = load_json(summary_file.read_bytes())
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            logger.warning("  Ignoring unreadable %s: %s", summary_file, e)
+            return False
+        return isinstance(existing, dict) and existing.get("idempotency_key") == idempotency_key
+
     def _log_run_header(self) -> None:
         """Print a header banner to indicate run start."""
         logger.info("=" * 60)
         logger.info("=== Daily automation run starting ===")
         logger.info("=" * 60)
 
-    def _build_summary(self, notes: List[str]) -> Dict[str, Any]:
-        """Generate or stub out the summary."""
-        if self.demo_mode:
-            logger.info("Using demo summary generation (no OpenAI calls)")
-            return self._generate_demo_summary(notes)
-        return self.generate_summary(notes)
-
-    def _handle_issues(self, summary: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _handle_issues(self, summary: Dict[str, Any], created_at: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """Create GitHub issues from action items if appropriate."""
         action_items = summary.get("action_items", [])
         if self.demo_mode:
-            logger.info(f"Skipping GitHub issue creation (demo_mode={self.demo_mode})")
+            logger.info("Skipping GitHub issue creation (demo_mode=%s)", self.demo_mode)
+            return []
+        if self.summary_source == "fallback":
+            logger.warning("⚠️  Skipping GitHub issue creation: the summary is the demo fallback")
             return []
         if action_items:
             logger.info("Creating GitHub issues from action items")
-            return self.create_github_issues(action_items)
+            return self.create_github_issues(action_items, created_at)
         logger.info("No action items to create issues from")
         return []
 
@@ -964,10 +1600,10 @@ class DailyAutomation:
         """Print a footer banner with run statistics."""
         logger.info("=" * 60)
         logger.info("✅ AUTOMATION COMPLETE")
-        logger.info(f"   Duration: {duration:.2f}s")
-        logger.info(f"   Notes: {note_count}")
-        logger.info(f"   Issues: {issue_count}")
-        logger.info(f"   Output: {output_file}")
+        logger.info("   Duration: %.2fs", duration)
+        logger.info("   Notes: %s", note_count)
+        logger.info("   Issues: %s", issue_count)
+        logger.info("   Output: %s", output_file)
         logger.info("=" * 60)
 
     def _log_demo_instructions(self) -> None:
@@ -1015,6 +1651,11 @@ def main(argv: Optional[List[str]] = None) -> int:
         action="store_true",
         help="Alias for --demo (no API calls, no external changes)"
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Summarize via the OpenAI Batch API (half price; the result is collected on a later --batch run)"
+    )
 
     args = parser.parse_args(argv)
 
@@ -1022,11 +1663,11 @@ def main(argv: Optional[List[str]] = None) -> int:
     demo_mode = args.demo or args.dry_run
 
     try:
-        automation = DailyAutomation(demo_mode=demo_mode)
+        automation = DailyAutomation(demo_mode=demo_mode, batch_mode=args.batch)
         return automation.run()
     except Exception as e:
         # Error already logged inside run() or __init__
-        logger.error(f"❌ Fatal error: {e}")
+        logger.error("❌ Fatal error: %s", e)
         return 1
 
 
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+JSON I/O
+========
+
+JSON encoding and decoding shared by the automation scripts.
+
+Uses orjson (C encoder/decoder, emits bytes) when it is installed and the
+standard library otherwise. Both backends write UTF-8 with the same indentation
+and accept non-string dict keys. They still differ at the edges: orjson rejects
+integers wider than 64 bits, writes NaN/Infinity as null and spells some floats
+differently (``1e16`` rather than ``1e+16``).
+"""
+
+import json
+from typing import Any
+
+# Prefer orjson when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dump_json_bytes(data: Any, compact: bool = False) -> bytes:
+    """Serialize ``data`` as UTF-8 JSON, using orjson when available.
+
+    Output is indented by two spaces unless ``compact`` is set, in which case
+    it has no whitespace between tokens.
+    """
+    if orjson is not None:
+        if compact:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    if compact:
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def load_json(data: Any) -> Any:
+    """Parse JSON from str or bytes, using orjson when available.
+
+    Both backends raise a ``ValueError`` subclass on malformed input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -8,7 +8,6 @@ Automated data collection for sales pipeline analytics.
 Integrates with CRM systems and sales tracking tools.
 """
 
-import json
 import logging
 import os
 from dataclasses import dataclass
@@ -16,6 +15,8 @@ from datetime import datetime, timezone
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+from lib.json_io import dump_json_bytes
+
 logger = logging.getLogger(__name__)
 
 # Constants
@@ -291,12 +292,14 @@ class SalesPipelineDataSource:
         logger.info("Pipedrive integration not yet implemented, using demo data")
         return self._demo_data()
     
-    def save_to_cache(self, data: SalesPipelineData) -> Path:
+    def save_to_cache(self, data: SalesPipelineData, payload: Optional[bytes] = None) -> Path:
         """
         Save pipeline data to cache file.
         
         Args:
             data: Sales pipeline data to cache
+            payload: Already-encoded JSON for ``data``, written as-is to skip
+                serializing it a second time
         
         Returns:
             Path to cached file
@@ -307,8 +310,9 @@ class SalesPipelineDataSource:
         timestamp_str = datetime.now(timezone.utc).strftime(TIMESTAMP_FORMAT)
         cache_file = self.config.cache_dir / f"sales_pipeline_{timestamp_str}.json"
         
-        with open(cache_file, "w", encoding="utf-8") as f:
-            json.dump(data.to_dict(), f, indent=2, ensure_ascii=False)
+        if payload is None:
+            payload = dump_json_bytes(data.to_dict())
+        cache_file.write_bytes(payload)
         
         logger.info(f"✓ Cached sales pipeline data to {cache_file}")
         return cache_file
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Summary Cache
+=============
+
+On-disk cache of OpenAI daily summaries.
+
+Entries are looked up by an exact key (a hash of the model settings and the
+formatted notes). Entries may also carry an embedding of the notes, so a run
+whose notes are nearly identical to a recent run can reuse that summary
+instead of requesting a new one.
+"""
+
+import logging
+import math
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from lib.json_io import dump_json_bytes, load_json
+
+logger = logging.getLogger(__name__)
+
+# Constants
+DEFAULT_MAX_ENTRIES = 32
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+
+def normalize(vector: Sequence[float]) -> List[float]:
+    """Return ``vector`` scaled to unit length (unchanged if it is zero)."""
+    norm = math.sqrt(sum(x * x for x in vector))
+    return [x / norm for x in vector] if norm else list(vector)
+
+
+class SummaryCache:
+    """Bounded, time-limited summary cache stored as a single JSON file."""
+
+    def __init__(
+        self,
+        path: Path,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            path: JSON file backing the cache
+            max_entries: Oldest entries beyond this count are evicted on store
+            ttl_seconds: Entries older than this are never returned
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the summary stored under ``key`` if present and not expired."""
+        entry = self._load().get(key)
+        if not self._is_fresh(entry, time.time()):
+            return None
+        return entry.get("summary")
+
+    def find_similar(self, embedding: Sequence[float], threshold: float) -> Optional[Dict[str, Any]]:
+        """
+        Return the summary whose notes embedding is most similar to ``embedding``.
+
+        Stored embeddings are unit length, so once the query is normalized the
+        cosine similarity of each entry is a plain dot product.
+
+        Args:
+            embedding: Embedding of the current notes
+            threshold: Minimum cosine similarity for a hit
+
+        Returns:
+            The best matching fresh summary, or None if none reaches the threshold
+        """
+        query = normalize(embedding)
+        now = time.time()
+        best_summary = None
+        best_score = threshold
+        for entry in self._load().values():
+            if not self._is_fresh(entry, now) or not isinstance(entry.get("embedding"), list):
+                continue
+            try:
+                score = sum(x * y for x, y in zip(query, entry["embedding"]))
+            except TypeError:
+                continue
+            if score >= best_score:
+                best_summary, best_score = entry.get("summary"), score
+
+        if best_summary is not None:
+            logger.debug("Semantic cache hit (similarity %.4f)", best_score)
+        return best_summary
+
+    def store(
+        self,
+        key: str,
+        summary: Dict[str, Any],
+        embedding: Optional[Sequence[float]] = None,
+    ) -> None:
+        """
+        Record a summary, evicting the oldest entries past ``max_entries``.
+
+        Args:
+            key: Exact-match cache key
+            summary: Summary to cache
+            embedding: Optional notes embedding for similarity lookups
+        """
+        cache = self._load()
+        cache.pop(key, None)
+        entry: Dict[str, Any] = {"cached_at": time.time(), "summary": summary}
+        if embedding is not None:
+            entry["embedding"] = normalize(embedding)
+        cache[key] = entry
+        for stale_key in list(cache)[:-self.max_entries]:
+            del cache[stale_key]
+
+        # Write to a temp file and rename so an interrupted write (or a
+        # concurrent run) never leaves a truncated cache behind.
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        try:
+            tmp_path.write_bytes(dump_json_bytes(cache, compact=True))
+            os.replace(tmp_path, self.path)
+        except (OSError, TypeError) as e:
+            logger.warning("  Failed to write summary cache %s: %s", self.path, e)
+
+    def _load(self) -> Dict[str, Any]:
+        """Load cached entries, treating a missing or corrupt file as empty."""
+        try:
+            cache = load_json(self.path.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("  Ignoring unreadable summary cache %s: %s", self.path, e)
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    def _is_fresh(self, entry: Any, now: float) -> bool:
+        """Return True if ``entry`` is a well-formed entry within the TTL.
+
+        Malformed entries (hand-edited or written by another version) are
+        treated as misses rather than raising into the caller.
+        """
+        if not isinstance(entry, dict) or not isinstance(entry.get("summary"), dict):
+            return False
+        cached_at = entry.get("cached_at")
+        if isinstance(cached_at, bool) or not isinstance(cached_at, (int, float)):
+            return False
+        return now - cached_at <= self.ttl_seconds
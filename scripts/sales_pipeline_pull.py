@@ -35,29 +35,41 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 
 
+class RunIdFilter(logging.Filter):
+    """Stamp ``run_id`` on records that reach the console handler."""
+
+    def __init__(self, run_id: str):
+        super().__init__()
+        self.run_id = run_id
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "run_id"):
+            setattr(record, "run_id", self.run_id)
+        return True
+
+
 def configure_logging() -> logging.Logger:
     """Configure structured logging with env-driven levels and run identifiers."""
     run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
     level_name = os.getenv("LOG_LEVEL", "INFO").upper()
     level = getattr(logging, level_name, logging.INFO)
 
-    # Ensure every log record gets the run_id field
-    old_factory = logging.getLogRecordFactory()
-
-    def record_factory(*args: Any, **kwargs: Any) -> logging.LogRecord:
-        record = old_factory(*args, **kwargs)
-        if not hasattr(record, "run_id"):
-            setattr(record, "run_id", run_id)
-        return record
-
-    logging.setLogRecordFactory(record_factory)
-
     logging.basicConfig(
         level=level,
         format="%(asctime)s [%(levelname)s] [run_id=%(run_id)s] %(name)s: %(message)s",
         datefmt="%Y-%m-%dT%H:%M:%S%z",
     )
 
+    # Stamp run_id in a handler filter rather than a global LogRecord factory,
+    # so records that are never emitted (e.g. SDK debug logging below the
+    # configured level) do not pay for it. The filter goes on every root
+    # handler, including ones installed before basicConfig (which then does
+    # nothing), so no emitted record lacks run_id.
+    run_id_filter = RunIdFilter(run_id)
+    for handler in logging.getLogger().handlers:
+        if not any(isinstance(f, RunIdFilter) for f in handler.filters):
+            handler.addFilter(run_id_filter)
+
     logger = logging.getLogger(__name__)
     logger.debug("Logging configured", extra={"run_id": run_id})
     return logger
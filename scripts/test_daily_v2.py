@@ -0,0 +1,696 @@
+#!/usr/bin/env python3
+"""
+Tests for Daily Automation Runner v2
+=====================================
+
+Test suite for daily_v2.py (demo mode and stubbed API clients, no network access)
+"""
+
+import os
+import sys
+import json
+import gzip
+import tempfile
+import shutil
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import daily_v2
+from daily_v2 import DailyAutomation
+
+
+def _make_automation(temp_dir: Path) -> DailyAutomation:
+    """Build a demo-mode runner whose notes and output live under temp_dir.
+
+    The directories are read from the environment at construction, so the
+    previous values are restored before returning.
+    """
+    overrides = {"OUTPUT_DIR": str(temp_dir / "output"), "NOTES_SOURCE": str(temp_dir / "notes")}
+    saved = {name: os.environ.get(name) for name in overrides}
+    os.environ.update(overrides)
+    try:
+        return DailyAutomation(demo_mode=True)
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                del os.environ[name]
+            else:
+                os.environ[name] = value
+
+
+class _StubOpenAI:
+    """OpenAI client stand-in: chat completions and the Batch API, with call counts."""
+
+    def __init__(self, summary):
+        self.summary = summary
+        self.chat_error = None
+        self.batch_status = "in_progress"
+        self.download_error = None
+        self.calls = {"chat": 0, "batch_create": 0, "batch_cancel": 0}
+        self.batch_request = None
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create_completion))
+        self.files = SimpleNamespace(create=self._create_file, content=self._file_content)
+        self.batches = SimpleNamespace(create=self._create_batch, retrieve=self._retrieve_batch, cancel=self._cancel_batch)
+
+    def _create_completion(self, **kwargs):
+        self.calls["chat"] += 1
+        if self.chat_error:
+            raise self.chat_error
+        message = SimpleNamespace(content=json.dumps(self.summary))
+        return SimpleNamespace(model="stub-model", choices=[SimpleNamespace(message=message, finish_reason="stop")])
+
+    def _create_file(self, file, purpose):
+        self.batch_request = json.loads(file[1])
+        return SimpleNamespace(id="file-in")
+
+    def _file_content(self, file_id):
+        if self.download_error:
+            raise self.download_error
+        body = {
+            "id": "chatcmpl-stub",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "stub-model",
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": json.dumps(self.summary)},
+            }],
+        }
+        line = {"custom_id": self.batch_request["custom_id"], "response": {"status_code": 200, "body": body}}
+        return SimpleNamespace(content=json.dumps(line).encode("utf-8"))
+
+    def _create_batch(self, **kwargs):
+        self.calls["batch_create"] += 1
+        return SimpleNamespace(id=f"batch_{self.calls['batch_create']}")
+
+    def _retrieve_batch(self, batch_id):
+        return SimpleNamespace(id=batch_id, status=self.batch_status, output_file_id="file-out")
+
+    def _cancel_batch(self, batch_id):
+        self.calls["batch_cancel"] += 1
+
+
+class _StubRepo:
+    """GitHub repository stand-in recording created issue titles.
+
+    Titles in ``failing`` raise, and ``delays`` maps a title to a sleep so
+    concurrent creations finish out of order.
+    """
+
+    def __init__(self, failing=(), delays=None):
+        self.failing = set(failing)
+        self.delays = delays or {}
+        self.created = []
+
+    def create_issue(self, title, body, labels):
+        time.sleep(self.delays.get(title, 0))
+        if title in self.failing:
+            raise RuntimeError(f"cannot create {title}")
+        self.created.append(title)
+        return SimpleNamespace(
+            number=len(self.created),
+            title=title,
+            html_url=f"https://github.com/example/repo/issues/{len(self.created)}",
+            labels=[SimpleNamespace(name=label) for label in labels],
+        )
+
+
+def _make_live_automation(temp_dir: Path, openai_client, repo, batch_mode: bool = False) -> DailyAutomation:
+    """Build a runner that takes the live code paths against stub clients."""
+    automation = _make_automation(temp_dir)
+    automation.demo_mode = False
+    automation.batch_mode = batch_mode
+    automation.openai_client = openai_client
+    automation.repo = repo
+    automation.pull_sales_pipeline_data = lambda: None
+    return automation
+
+
+def _write_notes(temp_dir: Path, *notes: str) -> None:
+    """Replace the notes directory contents with one file per note."""
+    notes_dir = temp_dir / "notes"
+    shutil.rmtree(notes_dir, ignore_errors=True)
+    notes_dir.mkdir(parents=True)
+    for i, note in enumerate(notes):
+        (notes_dir / f"{i:02d}.md").write_text(note, encoding="utf-8")
+
+
+def _read_daily_summary(temp_dir: Path):
+    return json.loads((temp_dir / "output" / "daily_summary.json").read_text(encoding="utf-8"))
+
+
+def test_read_notes_from_disk():
+    """Test that markdown and text notes are read, stripped, filtered, and ordered"""
+    print("Testing note ingestion from disk...")
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        automation = _make_automation(temp_dir)
+        notes_dir = temp_dir / "notes"
+        (notes_dir / "nested").mkdir(parents=True)
+        (notes_dir / "a.md").write_text("  Ship the release  \n", encoding="utf-8")
+        (notes_dir / "nested" / "b.txt").write_text("Fix export script", encoding="utf-8")
+        (notes_dir / "blank.md").write_text("   \n", encoding="utf-8")
+        (notes_dir / "ignored.json").write_text("{}", encoding="utf-8")
+        (notes_dir / "legacy.txt").write_bytes(b"Caf\xe9 follow-up")
+
+        notes = automation._read_notes_from_disk()
+
+        # a.md, legacy.txt, nested/b.txt - sorted by path for a stable prompt order
+        assert notes == ["Ship the release", "Caf\ufffd follow-up", "Fix export script"], f"Unexpected notes: {notes}"
+
+        print("  ✓ Note ingestion tests passed")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_read_many_notes_from_disk():
+    """Test that the threaded read path keeps path order"""
+    print("Testing threaded note ingestion...")
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        automation = _make_automation(temp_dir)
+        notes_dir = temp_dir / "notes"
+        count = daily_v2.NOTES_PARALLEL_MIN_FILES * 2
+        for i in range(count):
+            (notes_dir / f"{i:03d}.md").write_text(f"Note {i}", encoding="utf-8")
+
+        notes = automation._read_notes_from_disk()
+
+        assert notes == [f"Note {i}" for i in range(count)], f"Unexpected notes: {notes}"
+
+        print("  ✓ Threaded note ingestion tests passed")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_read_large_note_from_disk():
+    """Test that memory-mapped notes are trimmed and decoded like small ones"""
+    print("Testing large note ingestion...")
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        automation = _make_automation(temp_dir)
+        notes_dir = temp_dir / "notes"
+        body = b"Caf\xe9 " + b"x" * daily_v2.NOTE_MMAP_MIN_BYTES
+        (notes_dir / "large.md").write_bytes(b" \n\t" + body + b"\r\n  ")
+        (notes_dir / "large_blank.txt").write_bytes(b" " * daily_v2.NOTE_MMAP_MIN_BYTES)
+
+        notes = automation._read_notes_from_disk()
+
+        assert notes == [body.decode("utf-8", errors="replace")], "Large note not read as expected"
+
+        print("  ✓ Large note ingestion tests passed")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_ingest_notes_demo_fallback():
+    """Test that an empty notes directory falls back to demo notes"""
+    print("Testing demo note fallback...")
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        automation = _make_automation(temp_dir)
+
+        notes = automation.ingest_notes()
+
+        assert notes == automation._demo_notes(), "Expected demo notes for empty directory"
+
+        print("  ✓ Demo fallback tests passed")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_format_notes_for_prompt():
+    """Test numbered prompt formatting of notes"""
+    print("Testing prompt note formatting...")
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        automation = _make_automation(temp_dir)
+
+        assert automation._format_notes_for_prompt(["a", "b c"]) == "1. a\n2. b c", "Unexpected prompt formatting"
+        assert automation._format_notes_for_prompt([]) == "", "Expected empty prompt for no notes"
+
+        original_budget = daily_v2.NOTES_PROMPT_MAX_CHARS
+        daily_v2.NOTES_PROMPT_MAX_CHARS = 10
+        try:
+            formatted = automation._format_notes_for_prompt(["abcd", "efghijkl", "dropped"])
+        finally:
+            daily_v2.NOTES_PROMPT_MAX_CHARS = original_budget
+        expected = "1. abcd\n2. efghij" + daily_v2.NOTE_TRUNCATED_MARKER
+        assert formatted == expected, f"Notes past the budget should be cut: {formatted!r}"
+
+        print("  ✓ Prompt formatting tests passed")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_summary_cache_key():
+    """Test that the summary cache key tracks the formatted notes"""
+    print("Testing summary cache key...")
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        automation = _make_automation(temp_dir)
+        key = automation._summary_cache_key("1. Ship the release")
+
+        assert key == automation._summary_cache_key("1. Ship the release"), "Cache key should be stable"
+        assert key != automation._summary_cache_key("1. Ship the release today"), "Cache key should change with notes"
+        assert automation.summary_cache.path == automation.output_dir / daily_v2.SUMMARY_CACHE_FILE, "Cache should live in output dir"
+        assert automation.summary_cache.ttl_seconds == daily_v2.SUMMARY_CACHE_TTL_SECONDS, "Expected the default cache TTL"
+
+        print("  ✓ Summary cache key tests passed")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_summary_cache_ttl_from_env():
+    """Test that CACHE_TTL_DAYS sets the summary cache TTL"""
+    print("Testing summary cache TTL setting...")
+
+    temp_dir = Path(tempfile.mkdtemp())
+    os.environ["CACHE_TTL_DAYS"] = "0.5"
+    try:
+        automation = _make_automation(temp_dir)
+        assert automation.summary_cache.ttl_seconds == 12 * 60 * 60, "CACHE_TTL_DAYS not applied"
+
+        os.environ["CACHE_TTL_DAYS"] = "soon"
+        automation = _make_automation(temp_dir)
+        assert automation.summary_cache.ttl_seconds == daily_v2.SUMMARY_CACHE_TTL_SECONDS, "Invalid value should fall back"
+
+        print("  ✓ Summary cache TTL tests passed")
+    finally:
+        del os.environ["CACHE_TTL_DAYS"]
+        shutil.rmtree(temp_dir)
+
+
+def test_save_output():
+    """Test daily summary and audit log output"""
+    print("Testing save_output...")
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        automation = _make_automation(temp_dir)
+        summary = {
+            "highlights": ["Shipped release", None, "  "],
+            "action_items": ["Fix export", ""],
+            "assessment": "Solid day",
+        }
+
+        output_file = automation.save_output(["note"], summary, [])
+
+        data = json.loads(output_file.read_text(encoding="utf-8"))
+        assert data["summary_bullets"] == ["Shipped release"], "Empty highlights should be dropped"
+        assert data["action_items"] == ["Fix export"], "Empty action items should be dropped"
+        assert data["raw_text"] == "Summary:\nSolid day\nActions:\n- Fix export", f"Unexpected raw_text: {data['raw_text']!r}"
+        assert data["metadata"]["notes_count"] == 1, "Notes count mismatch"
+
+        audit_files = list(output_file.parent.glob("audit_*.json"))
+        assert len(audit_files) == 1, f"Expected one audit log, found {len(audit_files)}"
+        assert json.loads(audit_files[0].read_text(encoding="utf-8")) == data, "Audit log should match daily summary"
+
+        # A second save must replace daily_summary.json, not rewrite the
+        # inode the first audit log may share with it. The audit log is moved
+        # aside first so a same-second save cannot reuse its name.
+        earlier_audit = audit_files[0].rename(output_file.parent / "earlier_audit.json")
+        first_audit = earlier_audit.read_bytes()
+        automation.save_output(["note", "another"], summary, [])
+        assert earlier_audit.read_bytes() == first_audit, "Earlier audit log was modified"
+        assert json.loads(output_file.read_text(encoding="utf-8"))["metadata"]["notes_count"] == 2, "Summary not updated"
+
+        print("  ✓ save_output tests passed")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_save_output_without_action_items():
+    """Test raw_text placeholder and run timestamp when there are no action items"""
+    print("Testing save_output without action items...")
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        automation = _make_automation(temp_dir)
+
+        run_started = datetime(2024, 5, 1, 9, 30, tzinfo=timezone.utc)
+        output_file = automation.save_output(["note"], {"assessment": "Quiet day"}, [], timestamp=run_started)
+
+        data = json.loads(output_file.read_text(encoding="utf-8"))
+        assert data["raw_text"] == "Summary:\nQuiet day\nActions:\n(No action items)", f"Unexpected raw_text: {data['raw_text']!r}"
+        assert data["action_items"] == [], "Expected no action items"
+        assert data["created_at"] == run_started.isoformat(), "Run timestamp not used"
+        assert (output_file.parent / "audit_20240501_093000.json").exists(), "Audit log should be named after the run timestamp"
+
+        print("  ✓ save_output placeholder tests passed")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_idempotency_key():
+    """Test that a recorded idempotency key is recognized on the next run"""
+    print("Testing run idempotency key...")
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        automation = _make_automation(temp_dir)
+        run_started = datetime(2024, 5, 1, 9, 30, tzinfo=timezone.utc)
+        key = automation._run_idempotency_key(["note"], run_started)
+
+        assert key == automation._run_idempotency_key(["note"], run_started.replace(hour=18)), "Key should be stable within a day"
+        assert key != automation._run_idempotency_key(["note"], datetime(2024, 5, 2, tzinfo=timezone.utc)), "Key should change with the date"
+        assert key != automation._run_idempotency_key(["note", "another"], run_started), "Key should change with the notes"
+
+        assert not automation._already_processed(key), "Expected no match without a daily summary"
+        automation.save_output(["note"], {"assessment": "Quiet day"}, [], timestamp=run_started)
+        assert not automation._already_processed(key), "Expected no match when no key was recorded"
+        automation.save_output(["note"], {"assessment": "Quiet day"}, [], timestamp=run_started, idempotency_key=key)
+        assert automation._already_processed(key), "Recorded key should match"
+
+        print("  ✓ Idempotency key tests passed")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_save_output_gzip_audit():
+    """Test that AUDIT_GZIP writes a compressed audit log"""
+    print("Testing gzip audit log...")
+
+    temp_dir = Path(tempfile.mkdtemp())
+    os.environ["AUDIT_GZIP"] = "1"
+    try:
+        automation = _make_automation(temp_dir)
+
+        output_file = automation.save_output(["note"], {"assessment": "Quiet day"}, [])
+
+        audit_files = list(output_file.parent.glob("audit_*"))
+        assert len(audit_files) == 1, f"Expected one audit log, found {len(audit_files)}"
+        assert audit_files[0].name.endswith(".json.gz"), f"Expected gzip audit log, got {audit_files[0].name}"
+        with gzip.open(audit_files[0], "rb") as f:
+            assert f.read() == output_file.read_bytes(), "Compressed audit log should match daily summary"
+
+        print("  ✓ gzip audit log tests passed")
+    finally:
+        del os.environ["AUDIT_GZIP"]
+        shutil.rmtree(temp_dir)
+
+
+def test_save_output_compact_json():
+    """Test that COMPACT_JSON compacts daily_summary.json but not the audit log"""
+    print("Testing compact daily summary...")
+
+    temp_dir = Path(tempfile.mkdtemp())
+    os.environ["COMPACT_JSON"] = "1"
+    try:
+        automation = _make_automation(temp_dir)
+
+        output_file = automation.save_output(["note"], {"assessment": "Quiet day"}, [])
+
+        raw = output_file.read_text(encoding="utf-8")
+        assert "\n" not in raw and '":"' in raw, "Expected compact daily summary"
+        audit_files = list(output_file.parent.glob("audit_*.json"))
+        assert len(audit_files) == 1, f"Expected one audit log, found {len(audit_files)}"
+        assert audit_files[0].read_text(encoding="utf-8").startswith("{\n  "), "Audit log should stay indented"
+        assert json.loads(audit_files[0].read_text(encoding="utf-8")) == json.loads(raw), "Audit log should match daily summary"
+
+        print("  ✓ Compact daily summary tests passed")
+    finally:
+        del os.environ["COMPACT_JSON"]
+        shutil.rmtree(temp_dir)
+
+
+def test_generate_summary_cache_hit():
+    """Test that unchanged notes reuse the cached summary without a new request"""
+    print("Testing summary cache hit...")
+    if not daily_v2.HAS_DEPS:
+        print("  - Skipped: openai/PyGithub not installed")
+        return
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        summary = {"highlights": ["Shipped"], "action_items": ["Fix export"], "assessment": "Good day"}
+        client = _StubOpenAI(summary)
+        automation = _make_live_automation(temp_dir, client, _StubRepo())
+
+        assert automation.generate_summary(["note"]) == summary, "Expected the model summary"
+        assert automation.summary_source == "api", f"Unexpected source: {automation.summary_source}"
+        assert automation.generate_summary(["note"]) == summary, "Expected the cached summary"
+        assert automation.summary_source == "cache", f"Unexpected source: {automation.summary_source}"
+        assert client.calls["chat"] == 1, "Cached notes should not be summarized again"
+
+        automation.generate_summary(["another note"])
+        assert client.calls["chat"] == 2, "Changed notes should be summarized"
+
+        print("  ✓ Summary cache hit tests passed")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_create_github_issues_order_and_failures():
+    """Test that issues keep action-item order and failed items are skipped"""
+    print("Testing GitHub issue creation...")
+    if not daily_v2.HAS_DEPS:
+        print("  - Skipped: openai/PyGithub not installed")
+        return
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        repo = _StubRepo(failing={"Second"}, delays={"First": 0.05})
+        automation = _make_live_automation(temp_dir, _StubOpenAI({}), repo)
+        automation.config.issue_concurrency = 4
+
+        issues = automation.create_github_issues(["First", "Second", None, "  ", "Third"])
+
+        assert [issue["title"] for issue in issues] == ["First", "Third"], f"Unexpected issues: {issues}"
+        assert issues[0]["labels"] == ["automation", "daily-runner"], "Labels should be recorded"
+        assert repo.created == ["Third", "First"], "Stub should have finished out of order"
+
+        print("  ✓ GitHub issue creation tests passed")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_run_idempotency():
+    """Test that run() records its key only after a clean run and skips on a recorded key"""
+    print("Testing run() idempotency...")
+    if not daily_v2.HAS_DEPS:
+        print("  - Skipped: openai/PyGithub not installed")
+        return
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        _write_notes(temp_dir, "Ship the release", "Fix export")
+        summary = {"highlights": ["Shipped"], "action_items": ["First", "Second"], "assessment": "Good day"}
+        client = _StubOpenAI(summary)
+
+        # One issue fails: the run publishes but leaves no key, so the next
+        # run retries (from the summary cache) instead of skipping.
+        repo = _StubRepo(failing={"Second"})
+        assert _make_live_automation(temp_dir, client, repo).run() == 0, "Run should succeed"
+        assert "idempotency_key" not in _read_daily_summary(temp_dir), "Partial issue failure must not record the key"
+
+        repo.failing.clear()
+        automation = _make_live_automation(temp_dir, client, repo)
+        assert automation.run() == 0, "Retry should succeed"
+        assert automation.summary_source == "cache", f"Retry should reuse the cached summary: {automation.summary_source}"
+        assert "idempotency_key" in _read_daily_summary(temp_dir), "Clean run should record the key"
+        assert client.calls["chat"] == 1, "Summary should only be requested once"
+
+        # Same notes, same day: nothing is requested or created again.
+        created = list(repo.created)
+        automation = _make_live_automation(temp_dir, client, repo)
+        assert automation.run() == 0, "Skipped run should succeed"
+        assert automation.summary_source is None, "Skipped run should not generate a summary"
+        assert repo.created == created, "Skipped run must not create issues"
+
+        print("  ✓ run() idempotency tests passed")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_run_fallback_summary():
+    """Test that a failed summary request creates no issues and records no key"""
+    print("Testing run() with a fallback summary...")
+    if not daily_v2.HAS_DEPS:
+        print("  - Skipped: openai/PyGithub not installed")
+        return
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        _write_notes(temp_dir, "Ship the release")
+        client = _StubOpenAI({})
+        client.chat_error = RuntimeError("service unavailable")
+        repo = _StubRepo()
+        automation = _make_live_automation(temp_dir, client, repo)
+
+        assert automation.run() == 0, "Run should succeed with the fallback summary"
+        assert automation.summary_source == "fallback", f"Unexpected source: {automation.summary_source}"
+        assert repo.created == [], "Fallback action items must not become issues"
+        assert automation._handle_issues({"action_items": ["Fix export"]}) == [], "Fallback summaries should be skipped"
+        assert "idempotency_key" not in _read_daily_summary(temp_dir), "Fallback run must not record the key"
+
+        print("  ✓ run() fallback summary tests passed")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_run_batch_pending_and_collect():
+    """Test that --batch runs keep the last summary while pending and publish once"""
+    print("Testing run() in batch mode...")
+    if not daily_v2.HAS_DEPS:
+        print("  - Skipped: openai/PyGithub not installed")
+        return
+
+    temp_dir = Path(tempfile.mkdtemp())
+    os.environ["CACHE_TTL_DAYS"] = "0"
+    try:
+        _write_notes(temp_dir, "Ship the release")
+        summary = {"highlights": ["Shipped"], "action_items": ["First"], "assessment": "Good day"}
+        client = _StubOpenAI(summary)
+        repo = _StubRepo()
+        summary_file = temp_dir / "output" / "daily_summary.json"
+        pending_file = temp_dir / "output" / daily_v2.PENDING_BATCH_FILE
+
+        def run_batch():
+            automation = _make_live_automation(temp_dir, client, repo, batch_mode=True)
+            assert automation.run() == 0, "Batch run should succeed"
+            return automation
+
+        _make_automation(temp_dir)  # creates the output directory
+        summary_file.write_text('{"previous": true}', encoding="utf-8")
+
+        # Submitted, then still running: the last summary stays published and
+        # the batch is not resubmitted.
+        for _ in range(2):
+            automation = run_batch()
+            assert automation.summary_source == "pending", f"Unexpected source: {automation.summary_source}"
+            assert summary_file.read_text(encoding="utf-8") == '{"previous": true}', "Pending run must not save output"
+        assert client.calls["batch_create"] == 1, "Pending batch should not be resubmitted"
+
+        # A failed download keeps the batch recorded and the summary untouched.
+        client.batch_status = "completed"
+        client.download_error = RuntimeError("connection reset")
+        automation = run_batch()
+        assert automation.summary_source == "pending", f"Unexpected source: {automation.summary_source}"
+        assert pending_file.exists(), "Batch must stay recorded after a failed collection"
+        assert summary_file.read_text(encoding="utf-8") == '{"previous": true}', "Failed collection must not save output"
+
+        # Collected for the current notes: published as current even with a
+        # zero cache TTL, without resubmitting, and the key is recorded.
+        client.download_error = None
+        automation = run_batch()
+        assert automation.summary_source == "api", f"Unexpected source: {automation.summary_source}"
+        assert not pending_file.exists(), "Collected batch should be cleared"
+        assert _read_daily_summary(temp_dir)["action_items"] == ["First"], "Collected summary should be published"
+        assert "idempotency_key" in _read_daily_summary(temp_dir), "Collected current summary should record the key"
+        assert client.calls["batch_create"] == 1, "Collected notes must not be resubmitted"
+        assert repo.created == ["First"], f"Unexpected issues: {repo.created}"
+
+        run_batch()
+        assert client.calls["batch_create"] == 1 and repo.created == ["First"], "Same-day rerun should be skipped"
+
+        print("  ✓ run() batch mode tests passed")
+    finally:
+        del os.environ["CACHE_TTL_DAYS"]
+        shutil.rmtree(temp_dir)
+
+
+def test_run_batch_notes_changed():
+    """Test that changed notes cancel a running batch and publish a finished one as stale"""
+    print("Testing run() in batch mode with changed notes...")
+    if not daily_v2.HAS_DEPS:
+        print("  - Skipped: openai/PyGithub not installed")
+        return
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        summary = {"highlights": ["Shipped"], "action_items": ["First"], "assessment": "Good day"}
+        client = _StubOpenAI(summary)
+        repo = _StubRepo()
+
+        _write_notes(temp_dir, "Ship the release")
+        _make_live_automation(temp_dir, client, repo, batch_mode=True).run()
+
+        # Still running when the notes change: cancelled and replaced.
+        _write_notes(temp_dir, "Ship the release", "Fix export")
+        automation = _make_live_automation(temp_dir, client, repo, batch_mode=True)
+        assert automation.run() == 0, "Batch run should succeed"
+        assert automation.summary_source == "pending", f"Unexpected source: {automation.summary_source}"
+        assert client.calls == {"chat": 0, "batch_create": 2, "batch_cancel": 1}, f"Unexpected calls: {client.calls}"
+
+        # Finished but for earlier notes: published, today's notes submitted,
+        # and no key recorded so the next run still picks up today's batch.
+        client.batch_status = "completed"
+        _write_notes(temp_dir, "Ship the release", "Fix export", "Draft summary")
+        automation = _make_live_automation(temp_dir, client, repo, batch_mode=True)
+        assert automation.run() == 0, "Batch run should succeed"
+        assert automation.summary_source == "batch", f"Unexpected source: {automation.summary_source}"
+        assert client.calls["batch_create"] == 3, "Today's notes should be submitted"
+        data = _read_daily_summary(temp_dir)
+        assert data["action_items"] == ["First"], "Earlier batch summary should be published"
+        assert "idempotency_key" not in data, "Stale batch summary must not record the key"
+
+        print("  ✓ run() batch notes-changed tests passed")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def run_all_tests():
+    """Run all test suites"""
+    print("=" * 60)
+    print("Running Daily Automation Runner Tests")
+    print("=" * 60)
+    print()
+
+    tests = [
+        test_read_notes_from_disk,
+        test_read_many_notes_from_disk,
+        test_read_large_note_from_disk,
+        test_ingest_notes_demo_fallback,
+        test_format_notes_for_prompt,
+        test_summary_cache_key,
+        test_summary_cache_ttl_from_env,
+        test_save_output,
+        test_save_output_without_action_items,
+        test_idempotency_key,
+        test_save_output_gzip_audit,
+        test_save_output_compact_json,
+        test_generate_summary_cache_hit,
+        test_create_github_issues_order_and_failures,
+        test_run_idempotency,
+        test_run_fallback_summary,
+        test_run_batch_pending_and_collect,
+        test_run_batch_notes_changed,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"  ✗ Test failed: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  ✗ Test error: {e}")
+            failed += 1
+
+    print()
+    print("=" * 60)
+    print(f"Test Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
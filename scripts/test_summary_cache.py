@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Tests for Summary Cache
+=======================
+
+Test suite for lib/summary_cache.py
+"""
+
+import sys
+import json
+import tempfile
+import shutil
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from lib.summary_cache import SummaryCache, normalize
+
+
+SUMMARY = {"highlights": ["Shipped"], "action_items": [], "assessment": "Good day"}
+
+
+def test_normalize():
+    """Test normalization of simple vectors"""
+    print("Testing vector normalization...")
+
+    assert normalize([3.0, 4.0]) == [0.6, 0.8], "Expected a unit vector"
+    assert normalize([0.0, 0.0]) == [0.0, 0.0], "Zero vector should be left as is"
+
+    print("  ✓ Normalization tests passed")
+
+
+def test_round_trip_and_expiry():
+    """Test exact-key round-trip and TTL expiry"""
+    print("Testing cache round-trip and expiry...")
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        cache = SummaryCache(temp_dir / "cache.json", ttl_seconds=60)
+
+        assert cache.get("key") is None, "Expected miss before first store"
+
+        cache.store("key", SUMMARY)
+        assert cache.get("key") == SUMMARY, "Cached summary mismatch"
+
+        data = json.loads(cache.path.read_text(encoding="utf-8"))
+        data["key"]["cached_at"] -= 61
+        cache.path.write_text(json.dumps(data), encoding="utf-8")
+        assert cache.get("key") is None, "Expired entry should not be served"
+
+        print("  ✓ Round-trip and expiry tests passed")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_eviction():
+    """Test that the oldest entries are evicted past max_entries"""
+    print("Testing cache eviction...")
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        cache = SummaryCache(temp_dir / "cache.json", max_entries=3)
+
+        for i in range(4):
+            cache.store(f"key-{i}", SUMMARY)
+
+        assert cache.get("key-0") is None, "Oldest entry should have been evicted"
+        assert all(cache.get(f"key-{i}") == SUMMARY for i in range(1, 4)), "Newest entries should remain"
+
+        print("  ✓ Eviction tests passed")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_find_similar():
+    """Test semantic lookup by embedding similarity"""
+    print("Testing semantic lookup...")
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        cache = SummaryCache(temp_dir / "cache.json")
+        other = {"highlights": [], "action_items": [], "assessment": "Other day"}
+        cache.store("a", SUMMARY, [2.0, 0.0, 0.0])
+        cache.store("b", other, [0.0, 1.0, 0.0])
+        cache.store("c", other)
+
+        assert cache.find_similar([0.99, 0.05, 0.0], 0.9) == SUMMARY, "Expected the closest entry"
+        assert cache.find_similar([0.6, 0.6, 0.5], 0.9) is None, "Expected no hit below threshold"
+
+        data = json.loads(cache.path.read_text(encoding="utf-8"))
+        assert data["a"]["embedding"] == [1.0, 0.0, 0.0], "Embeddings should be stored normalized"
+
+        print("  ✓ Semantic lookup tests passed")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_corrupt_file():
+    """Test that an unreadable cache file is treated as empty"""
+    print("Testing corrupt cache file...")
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        cache = SummaryCache(temp_dir / "cache.json")
+        cache.path.write_text("{not json", encoding="utf-8")
+
+        assert cache.get("key") is None, "Corrupt cache should miss"
+        cache.store("key", SUMMARY)
+        assert cache.get("key") == SUMMARY, "Store should replace a corrupt cache"
+
+        print("  ✓ Corrupt cache tests passed")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_malformed_entries():
+    """Test that malformed entries are treated as misses"""
+    print("Testing malformed cache entries...")
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        cache = SummaryCache(temp_dir / "cache.json")
+        cache.store("good", SUMMARY, [1.0, 0.0])
+        data = json.loads(cache.path.read_text(encoding="utf-8"))
+        data["bad-time"] = {"cached_at": "yesterday", "summary": SUMMARY, "embedding": [1.0, 0.0]}
+        data["bad-summary"] = {"cached_at": data["good"]["cached_at"], "summary": "text", "embedding": [1.0, 0.0]}
+        data["not-a-dict"] = ["x"]
+        data["bad-embedding"] = {"cached_at": data["good"]["cached_at"], "summary": {}, "embedding": ["a", "b"]}
+        cache.path.write_text(json.dumps(data), encoding="utf-8")
+
+        assert cache.get("bad-time") is None, "Non-numeric cached_at should miss"
+        assert cache.get("bad-summary") is None, "Non-dict summary should miss"
+        assert cache.get("not-a-dict") is None, "Non-dict entry should miss"
+        assert cache.get("good") == SUMMARY, "Well-formed entry should still hit"
+        assert cache.find_similar([1.0, 0.0], 0.9) == SUMMARY, "Semantic lookup should skip malformed entries"
+
+        print("  ✓ Malformed entry tests passed")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def run_all_tests():
+    """Run all test suites"""
+    print("=" * 60)
+    print("Running Summary Cache Tests")
+    print("=" * 60)
+    print()
+
+    tests = [
+        test_normalize,
+        test_round_trip_and_expiry,
+        test_eviction,
+        test_find_similar,
+        test_corrupt_file,
+        test_malformed_entries,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"  ✗ Test failed: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  ✗ Test error: {e}")
+            failed += 1
+
+    print()
+    print("=" * 60)
+    print(f"Test Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())